@@ -13,7 +13,10 @@ Version: 2.0.0 (Absolute Freedom Edition)
 """
 
 import asyncio
+import atexit
+import functools
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from urllib.parse import urlparse
@@ -31,16 +34,43 @@ from deadman_scraper.utils.sanitizer import InputSanitizer
 from deadman_scraper.utils.traceability import AuditLogger
 
 # === NASA STANDARD LOGGING ===
+# Buffered file logging: delay=True defers opening the log file until first
+# write, and the MemoryHandler batches records so burst scraping doesn't pay
+# a write()+flush() syscall per log line. Errors still flush immediately.
+_LOG_FORMAT = '%(asctime)s [%(levelname)s] %(name)s.%(funcName)s:%(lineno)d - %(message)s'
+
+_file_handler = logging.FileHandler("central_scraper.log", delay=True, encoding='utf-8')
+# basicConfig only formats the handlers it is handed; the MemoryHandler's
+# target renders the flushed records, so it needs the formatter itself
+_file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+_buffered_handler = logging.handlers.MemoryHandler(
+    capacity=1024,
+    flushLevel=logging.ERROR,
+    target=_file_handler
+)
+atexit.register(_buffered_handler.flush)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(name)s.%(funcName)s:%(lineno)d - %(message)s',
+    format=_LOG_FORMAT,
     handlers=[
-        logging.FileHandler("central_scraper.log"),
+        _buffered_handler,
         logging.StreamHandler(sys.stdout)
     ]
 )
 logger = logging.getLogger("CentralScraper")
 
+# === SANITIZER MEMOIZATION ===
+# Crawls revisit the same URLs constantly (redirects, canonicalization), so
+# cache sanitizer verdicts: a hit is a dict lookup instead of regex/parse work.
+_cached_sanitize_url = functools.lru_cache(maxsize=16384)(InputSanitizer.sanitize_url)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_clean_headers(header_items: tuple[tuple[str, str], ...]) -> tuple[tuple[str, str], ...]:
+    """Memoized header cleaning keyed by the hashable (sorted) header items."""
+    return tuple(InputSanitizer.clean_headers(dict(header_items)).items())
+
 
 class ScrapeRequest(BaseModel):
     """
@@ -97,13 +127,13 @@ class CentralScraper:
         if not self.engine:
             raise RuntimeError("Engine not started. Use 'async with' context manager.")
 
-        # 1. Sanitize Inputs
-        safe_url = InputSanitizer.sanitize_url(request.url)
+        # 1. Sanitize Inputs (memoized — see module-level caches)
+        safe_url = _cached_sanitize_url(request.url)
         if not safe_url:
             return ScrapeResult(url=request.url, success=False, error="Input Sanitization Failed (Invalid URL)")
 
         request.url = safe_url
-        request.headers = InputSanitizer.clean_headers(request.headers)
+        request.headers = dict(_cached_clean_headers(tuple(sorted(request.headers.items()))))
 
         # 2. Session Hijacking (if requested)
         if request.steal_session:
@@ -2,16 +2,13 @@
 """DEADMAN ULTIMATE SCRAPER - CLI Interface"""
 
 import asyncio
+import functools
 import json
 import sys
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich import print as rprint
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 try:
     from .deep_commands import register_deep_commands
@@ -25,8 +22,80 @@ try:
 except ImportError:
     HAS_DARKWEB = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 app = typer.Typer(name="deadman", help="DEADMAN ULTIMATE SCRAPER", add_completion=False)
-console = Console()
+
+
+class _LazyConsole:
+    """
+    Defers Rich Console construction (terminal probing, codepage setup) until
+    first output, and drops color/highlighting when stdout is redirected so
+    piped runs skip ANSI processing entirely.
+    """
+
+    _console = None
+
+    def __getattr__(self, name):
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console(
+                legacy_windows=(sys.platform == "win32"),
+                no_color=not sys.stdout.isatty(),
+                highlight=False,
+            )
+        return getattr(_LazyConsole._console, name)
+
+
+console = _LazyConsole()
+
+
+def _dump_json(obj, path: Path):
+    """Serialize to pretty JSON — orjson (Rust, ~5x faster) when available."""
+    if HAS_ORJSON:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+def _dumps_line(obj) -> bytes:
+    """Serialize one JSONL record to UTF-8 bytes (newline included)."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _open_jsonl(path: Path):
+    """Open a JSONL output file with a 1MB write buffer — bytes land on disk
+    in large blocks instead of one syscall per record."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return open(path, "wb", buffering=1 << 20)
+
+
+@functools.lru_cache(maxsize=1)
+def _cfg():
+    """Load config + API keys once per process — env/YAML parsing is not free
+    when commands are chained or the module is imported repeatedly."""
+    from deadman_scraper import Config
+    config = Config.from_env()
+    config.load_api_keys()
+    return config
+
+
+def _normalize_url(url: str) -> str:
+    """Canonicalize a URL for dedup: drop fragment, sort query params."""
+    from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+    try:
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+    except ValueError:
+        return url
 
 # --- BLACK HAT THEME CONFIG ---
 HEADER_STYLE = "bold cyan"
@@ -35,6 +104,9 @@ FAIL_STYLE = "bold red"
 INFO_STYLE = "bold white"
 PANEL_STYLE = "green"
 
+# Quota usage color bands: first threshold the percentage exceeds wins
+_COLOR_BANDS = ((90.0, FAIL_STYLE), (70.0, "yellow"), (-1.0, SUCCESS_STYLE))
+
 # Register deep scraping commands
 if HAS_DEEP:
     register_deep_commands(app)
@@ -45,6 +117,8 @@ if HAS_DARKWEB:
 
 def version_callback(value: bool):
     if value:
+        from rich import print as rprint
+
         from deadman_scraper import __version__
         rprint(f"[{HEADER_STYLE}]DEADMAN ULTIMATE SCRAPER[/] v{__version__} // [bold red]DEATH INCARNATE[/]")
         raise typer.Exit()
@@ -68,9 +142,8 @@ def scrape(
 ):
     """Scrape a single URL with adaptive bypass."""
     async def _scrape():
-        from deadman_scraper import Engine, Config
-        config = Config.from_env()
-        config.load_api_keys()
+        from deadman_scraper import Engine
+        config = _cfg()
         console.print(f"[{HEADER_STYLE}]Initiating Scrape Protocols:[/] [white]{url}[/]")
         async with Engine(config) as engine:
             result = await engine.scrape(url, use_tor=tor, extract_strategy=extract, use_llm=llm)
@@ -83,17 +156,17 @@ def scrape(
             if output:
                 output.parent.mkdir(parents=True, exist_ok=True)
                 data = {"url": result.url, "status_code": result.status_code, "content_type": result.content_type, "fetch_layer": result.fetch_layer, "content": result.content, "extracted": result.extracted}
-                with open(output, "w", encoding="utf-8") as f:
-                    if format == "json":
-                        json.dump(data, f, indent=2, ensure_ascii=False)
-                    elif format == "md":
-                        f.write("# " + url + "\n\n" + (result.content or ""))
-                    else:
-                        f.write(result.content or "")
+                if format == "json":
+                    _dump_json(data, output)
+                elif format == "md":
+                    output.write_text("# " + url + "\n\n" + (result.content or ""), encoding="utf-8")
+                else:
+                    output.write_text(result.content or "", encoding="utf-8")
                 console.print(f"[{INFO_STYLE}]Intelligence Persisted:[/] {output}")
             else:
                 if result.content:
                     preview = result.content[:500] + "..." if len(result.content) > 500 else result.content
+                    from rich.panel import Panel
                     console.print(Panel(preview, title="Intelligence Preview", border_style=PANEL_STYLE))
         else:
             console.print(f"\n[{FAIL_STYLE}]Protocols Failed:[/] {result.error}")
@@ -112,29 +185,32 @@ def search(
 ):
     """Multi-engine search with optional intelligence extraction."""
     async def _search():
-        from deadman_scraper import Engine, Config
-        config = Config.from_env()
-        config.load_api_keys()
+        from deadman_scraper import Engine
+        config = _cfg()
         engine_list = engines.split(",") if engines else None
         console.print(f"\n[{HEADER_STYLE}]Initiating Wide-Spectrum Search:[/] [white]{query}[/]")
         async with Engine(config) as engine:
             if scrape_top > 0:
                 console.print(f"[{INFO_STYLE}]Exploiting top {scrape_top} targets...[/]\n")
-                results = []
-                async for result in engine.search_and_scrape(query, engines=engine_list, max_results=max_results, scrape_top=scrape_top, darkweb=darkweb, filter_llm=filter_llm):
-                    status = f"[{SUCCESS_STYLE}]OK[/]" if result.success else f"[{FAIL_STYLE}]FAIL[/]"
-                    console.print(f"  {status} {result.url}")
-                    results.append({"url": result.url, "success": result.success, "content_preview": result.content[:200] if result.content else None})
+                f = _open_jsonl(output) if output else None
+                try:
+                    async for result in engine.search_and_scrape(query, engines=engine_list, max_results=max_results, scrape_top=scrape_top, darkweb=darkweb, filter_llm=filter_llm):
+                        status = f"[{SUCCESS_STYLE}]OK[/]" if result.success else f"[{FAIL_STYLE}]FAIL[/]"
+                        console.print(f"  {status} {result.url}")
+                        if f:
+                            record = {"url": result.url, "success": result.success, "content_preview": result.content[:200] if result.content else None}
+                            f.write(_dumps_line(record))
+                finally:
+                    if f:
+                        f.close()
                 if output:
-                    output.parent.mkdir(parents=True, exist_ok=True)
-                    with open(output, "w", encoding="utf-8") as f:
-                        json.dump(results, f, indent=2, ensure_ascii=False)
                     console.print(f"\n[{INFO_STYLE}]Data Persisted:[/] {output}")
             else:
                 from deadman_scraper.discovery.aggregator import SearchAggregator
                 aggregator = SearchAggregator(config)
                 results = await aggregator.search(query, engines=engine_list, max_results=max_results, darkweb=darkweb)
                 console.print(f"\n[{SUCCESS_STYLE}]Found {len(results)} intelligence vectors[/]\n")
+                from rich.table import Table
                 table = Table(title="Intelligence Inventory", border_style=PANEL_STYLE)
                 table.add_column("Title", style=INFO_STYLE)
                 table.add_column("URL", style="blue")
@@ -144,8 +220,7 @@ def search(
                 console.print(table)
                 if output:
                     output.parent.mkdir(parents=True, exist_ok=True)
-                    with open(output, "w", encoding="utf-8") as f:
-                        json.dump(results, f, indent=2, ensure_ascii=False)
+                    _dump_json(results, output)
                     console.print(f"\n[{INFO_STYLE}]Inventory Persisted:[/] {output}")
     asyncio.run(_search())
 
@@ -153,7 +228,7 @@ def search(
 def batch(
     urls_file: Path = typer.Argument(..., help="File with URLs"),
     output: Optional[Path] = typer.Option(None, "-o", "--output", help="Output file"),
-    format: str = typer.Option("json", "-f", "--format", help="Output format"),
+    format: str = typer.Option("jsonl", "-f", "--format", help="Output format"),
     concurrency: int = typer.Option(5, "-c", "--concurrency", help="Concurrent requests"),
     tor: bool = typer.Option(False, "--tor", help="Force TOR routing"),
 ):
@@ -161,28 +236,39 @@ def batch(
     if not urls_file.exists():
         console.print(f"[{FAIL_STYLE}]Error:[/] Target manifest not found: {urls_file}")
         raise typer.Exit(1)
-    urls = [line.strip() for line in urls_file.read_text().splitlines() if line.strip()]
+    raw_urls = [line.strip() for line in urls_file.read_text().splitlines() if line.strip()]
+    # Normalize + dedupe before dispatch — duplicate targets waste fetches
+    urls = list(dict.fromkeys(_normalize_url(u) for u in raw_urls))
+    if len(urls) < len(raw_urls):
+        console.print(f"[{INFO_STYLE}]Deduplicated {len(raw_urls) - len(urls)} duplicate targets[/]")
     console.print(f"\n[{HEADER_STYLE}]Initiating Batch Exploitation:[/] [white]{len(urls)} targets[/]\n")
     async def _batch():
-        from deadman_scraper import Engine, Config
-        config = Config.from_env()
+        from deadman_scraper import Engine
+        # Copy before mutating so the cached config stays pristine
+        config = _cfg().model_copy(deep=True)
         config.fetch.max_concurrent = concurrency
-        results, success, failed = [], 0, 0
-        async with Engine(config) as engine:
-            async for result in engine.scrape_many(urls, meta={"force_tor": tor}):
-                if result.success:
-                    success += 1
-                    stat = f"[{SUCCESS_STYLE}]OK[/]"
-                else:
-                    failed += 1
-                    stat = f"[{FAIL_STYLE}]FAIL[/]"
-                console.print(f"  {stat} {result.url}")
-                results.append({"url": result.url, "success": result.success, "status_code": result.status_code, "error": result.error, "content_length": len(result.content) if result.content else 0})
+        # Stream results to JSONL as they complete — memory stays O(1) for
+        # huge batches and the output file can be tailed mid-run.
+        f = _open_jsonl(output) if output else None
+        success, failed = 0, 0
+        try:
+            async with Engine(config) as engine:
+                async for result in engine.scrape_many(urls, meta={"force_tor": tor}):
+                    if result.success:
+                        success += 1
+                        stat = f"[{SUCCESS_STYLE}]OK[/]"
+                    else:
+                        failed += 1
+                        stat = f"[{FAIL_STYLE}]FAIL[/]"
+                    console.print(f"  {stat} {result.url}")
+                    if f:
+                        record = {"url": result.url, "success": result.success, "status_code": result.status_code, "error": result.error, "content_length": len(result.content) if result.content else 0}
+                        f.write(_dumps_line(record))
+        finally:
+            if f:
+                f.close()
         console.print(f"\n[{SUCCESS_STYLE}]Success: {success}[/] | [{FAIL_STYLE}]Failed: {failed}[/]")
         if output:
-            output.parent.mkdir(parents=True, exist_ok=True)
-            with open(output, "w", encoding="utf-8") as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
             console.print(f"[{INFO_STYLE}]Batch Data Persisted:[/] {output}")
     asyncio.run(_batch())
 
@@ -190,10 +276,8 @@ def batch(
 def tor(action: str = typer.Argument("status", help="Action: start/stop/restart/status")):
     """Manage TOR proxy circuit integrity."""
     async def _tor():
-        from deadman_scraper.core.config import Config
         from deadman_scraper.fetch.tor import TORManager
-        config = Config.from_env()
-        manager = TORManager(config.tor)
+        manager = TORManager(_cfg().tor)
         if action == "start":
             console.print(f"[{HEADER_STYLE}]Activating TOR Circuit...[/]")
             ok = await manager.start()
@@ -222,6 +306,7 @@ def tor(action: str = typer.Argument("status", help="Action: start/stop/restart/
                 console.print(f"[{FAIL_STYLE}]Renewal Failed[/]")
         else:
             st = await manager.status()
+            from rich.table import Table
             table = Table(title="TOR Circuit Telemetry", border_style=PANEL_STYLE)
             table.add_column("Property", style=HEADER_STYLE)
             table.add_column("Value")
@@ -246,6 +331,7 @@ def config(
     config_file = Path("config/default.yaml")
     if action == "show":
         cfg = Config.from_env()
+        from rich.panel import Panel
         console.print(Panel(yaml.dump(cfg.model_dump(), default_flow_style=False), title="System Configuration", border_style=PANEL_STYLE))
     elif action == "set":
         if not key or not value:
@@ -262,12 +348,11 @@ def config(
 def stats():
     """Display real-time quota telemetry and usage analytics."""
     async def _stats():
-        from deadman_scraper.core.config import Config
         from deadman_scraper.ai.llm_router import FreeLLMRouter
-        cfg = Config.from_env()
-        cfg.load_api_keys()
+        cfg = _cfg()
         router = FreeLLMRouter(cfg.llm, cfg.api_keys)
         st = router.get_quota_status()
+        from rich.table import Table
         table = Table(title="Weaponry Quota Telemetry", border_style=PANEL_STYLE)
         table.add_column("Source", style=HEADER_STYLE)
         table.add_column("Used", justify="right")
@@ -277,13 +362,8 @@ def stats():
         table.add_column("Attrition", justify="right")
         for name, info in st.items():
             pct = info["percent_used"]
-            pct_str = f"{pct:.1f}%"
-            if pct > 90:
-                pct_str = f"[{FAIL_STYLE}]{pct_str}[/]"
-            elif pct > 70:
-                pct_str = f"[yellow]{pct_str}[/]"
-            else:
-                pct_str = f"[{SUCCESS_STYLE}]{pct_str}[/]"
+            color = next(c for t, c in _COLOR_BANDS if pct > t)
+            pct_str = f"[{color}]{pct:.1f}%[/]"
             table.add_row(name.capitalize(), str(info["used"]), str(info["remaining"]), str(info["limit"]), info["period"], pct_str)
         console.print(table)
     asyncio.run(_stats())
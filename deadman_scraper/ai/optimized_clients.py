@@ -5,7 +5,7 @@ Drop-in replacements with automatic token optimization and caching.
 Ensures "Free Forever" compliance by minimizing payload size.
 """
 
-import asyncio
+import functools
 import logging
 
 from .token_optimizer import TokenOptimizer
@@ -14,16 +14,36 @@ from .llm_router import LLMResponse
 
 logger = logging.getLogger("OptimizedLLM")
 
+
+# Shared instances: constructing a TokenOptimizer opens the on-disk cache and
+# each SDK client owns an HTTP connection pool, so reuse them across the
+# wrapper objects the CLI builds per command.
+@functools.lru_cache(maxsize=8)
+def _get_optimizer(cache_dir: str) -> TokenOptimizer:
+    return TokenOptimizer(cache_dir=cache_dir)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_mistral_client(api_key: str):
+    from mistralai import Mistral
+    return Mistral(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_groq_client(api_key: str):
+    from groq import AsyncGroq
+    return AsyncGroq(api_key=api_key)
+
+
 class OptimizedMistral:
     """
     Auto-optimizing wrapper for Mistral AI.
     Reduces token usage by ~40%.
     """
     def __init__(self, api_key: str, model: str = "mistral-small", cache_dir: str = "data/cache"):
-        from mistralai import Mistral
-        self.client = Mistral(api_key=api_key)
+        self.client = _get_mistral_client(api_key)
         self.model = model
-        self.optimizer = TokenOptimizer(cache_dir=cache_dir)
+        self.optimizer = _get_optimizer(cache_dir)
 
     async def complete(self, prompt: str, **kwargs) -> LLMResponse:
         # 1. Optimize
@@ -34,10 +54,9 @@ class OptimizedMistral:
         if cached:
             return LLMResponse(success=True, content=cached, provider="mistral_cache")
 
-        # 3. Call Mistral
+        # 3. Call Mistral (native async — no thread hop per request)
         try:
-            response = await asyncio.to_thread(
-                self.client.chat.complete,
+            response = await self.client.chat.complete_async(
                 model=self.model,
                 messages=[{"role": "user", "content": clean_prompt}],
                 **kwargs
@@ -64,10 +83,9 @@ class OptimizedGroq:
     Essential for staying within the 14,400 req/day limit.
     """
     def __init__(self, api_key: str, model: str = "llama-3.3-70b-versatile", cache_dir: str = "data/cache"):
-        from groq import Groq
-        self.client = Groq(api_key=api_key)
+        self.client = _get_groq_client(api_key)
         self.model = model
-        self.optimizer = TokenOptimizer(cache_dir=cache_dir)
+        self.optimizer = _get_optimizer(cache_dir)
 
     async def complete(self, prompt: str, **kwargs) -> LLMResponse:
         clean_prompt = self.optimizer.optimize_prompt(prompt)
@@ -77,8 +95,7 @@ class OptimizedGroq:
             return LLMResponse(success=True, content=cached, provider="groq_cache")
 
         try:
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create,
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[{"role": "user", "content": clean_prompt}],
                 **kwargs
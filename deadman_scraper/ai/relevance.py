@@ -7,7 +7,12 @@ LLM-powered content relevance scoring for filtering search results.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+import re
+import sqlite3
+import time
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -16,6 +21,66 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class _ScoreCache:
+    """
+    Persistent (query, url, snippet) -> score cache backed by SQLite.
+
+    The same URL routinely appears across engines in SearchAggregator and
+    users iterate on queries, so memoizing scores avoids re-spending LLM
+    quota on tuples already rated.
+    """
+
+    def __init__(self, db_path: str = "data/cache/relevance_scores.db", ttl: int = 86400):
+        self.db_path = db_path
+        self.ttl = ttl
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is None:
+            try:
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(self.db_path)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY, score REAL, ts REAL)"
+                )
+            except sqlite3.Error as e:
+                logger.debug(f"Relevance cache unavailable: {e}")
+        return self._conn
+
+    @staticmethod
+    def make_key(query: str, result: dict[str, Any]) -> str:
+        raw = f"{query}\0{result.get('url', '')}\0{result.get('snippet', '')[:512]}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> float | None:
+        conn = self._connect()
+        if not conn:
+            return None
+        try:
+            row = conn.execute("SELECT score, ts FROM scores WHERE key = ?", (key,)).fetchone()
+            if row and time.time() - row[1] < self.ttl:
+                return row[0]
+        except sqlite3.Error:
+            pass
+        return None
+
+    def set(self, key: str, score: float):
+        conn = self._connect()
+        if not conn:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO scores (key, score, ts) VALUES (?, ?, ?)",
+                (key, score, time.time())
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+_score_cache = _ScoreCache()
+
+
 RELEVANCE_PROMPT = """Rate the relevance of this search result to the query.
 
 Query: {query}
@@ -33,6 +98,110 @@ Consider:
 Respond with ONLY a number between 0.0 and 1.0, nothing else."""
 
 
+BATCH_RELEVANCE_PROMPT = """Rate the relevance of each search result to the query.
+
+Query: {query}
+
+Results:
+{results}
+
+Rate each result from 0.0 (completely irrelevant) to 1.0 (highly relevant).
+Consider:
+- Does the title/snippet directly address the query?
+- Is the source likely to have quality information?
+- Is this a primary source or aggregator?
+
+Respond with ONLY a JSON array of floats, one per result in order, nothing else."""
+
+# One LLM round trip per chunk instead of per result; sized so the prompt
+# stays well inside free-tier context limits.
+BATCH_CHUNK_SIZE = 20
+
+
+def _compile_prompt(template: str, *fields: str):
+    """
+    Pre-split a prompt template at its placeholders so hot-path rendering
+    is a single str.join instead of re-running the str.format mini-parser
+    on every call. Literal double braces are unescaped once here.
+    """
+    parts = []
+    rest = template
+    for field in fields:
+        head, rest = rest.split("{" + field + "}", 1)
+        parts.append(head)
+    parts.append(rest)
+    parts = [p.replace("{{", "{").replace("}}", "}") for p in parts]
+
+    def render(*values: str) -> str:
+        out = [parts[0]]
+        for value, part in zip(values, parts[1:]):
+            out.append(value)
+            out.append(part)
+        return "".join(out)
+
+    return render
+
+
+_render_relevance = _compile_prompt(RELEVANCE_PROMPT, "query", "title", "url", "snippet")
+_render_batch_relevance = _compile_prompt(BATCH_RELEVANCE_PROMPT, "query", "results")
+
+# Pulls the JSON payload out of a markdown code fence in one scan instead of
+# the split("```")/startswith chain, which allocates intermediate lists.
+_JSON_FENCE = re.compile(r"```(?:json)?\s*([\[{].*[\]}])\s*```", re.DOTALL)
+
+
+def _strip_json_fence(content: str) -> str:
+    m = _JSON_FENCE.search(content)
+    return m.group(1) if m else content.strip()
+
+
+async def _batch_score(
+    query: str,
+    results_chunk: list[dict[str, Any]],
+    llm_router: FreeLLMRouter,
+) -> list[float]:
+    """
+    Score a chunk of results with a single LLM call.
+
+    Returns one score per result, falling back to 0.5 defaults when the
+    response cannot be parsed.
+    """
+    import json
+
+    from deadman_scraper.ai.llm_router import TaskType
+
+    lines = [
+        f"{i + 1}) {r.get('title', '')} | {r.get('url', '')} | {r.get('snippet', '')}"
+        for i, r in enumerate(results_chunk)
+    ]
+    prompt = _render_batch_relevance(query, "\n".join(lines))
+
+    response = await llm_router.complete(
+        prompt,
+        task_type=TaskType.RELEVANCE_SCORING,
+        max_tokens=8 * len(results_chunk),
+        temperature=0.1,
+    )
+
+    if not response.success:
+        logger.debug(f"Batch relevance scoring failed: {response.error}")
+        return [0.5] * len(results_chunk)
+
+    try:
+        scores = json.loads(_strip_json_fence(response.content))
+        if not isinstance(scores, list):
+            raise ValueError("expected a JSON array")
+        scores = [max(0.0, min(1.0, float(s))) for s in scores]
+    except (ValueError, json.JSONDecodeError):
+        logger.debug(f"Invalid batch relevance scores: {response.content}")
+        return [0.5] * len(results_chunk)
+
+    # Pad/trim so callers can always zip scores against the chunk
+    if len(scores) < len(results_chunk):
+        scores.extend([0.5] * (len(results_chunk) - len(scores)))
+    return scores[:len(results_chunk)]
+
+
 async def score_relevance(
     query: str,
     result: dict[str, Any],
@@ -51,11 +220,30 @@ async def score_relevance(
     """
     from deadman_scraper.ai.llm_router import TaskType
 
-    prompt = RELEVANCE_PROMPT.format(
-        query=query,
-        title=result.get("title", ""),
-        url=result.get("url", ""),
-        snippet=result.get("snippet", ""),
+    # Short-circuit obviously broken results (empty titles/snippets are
+    # routine in DuckDuckGo/Bing HTML scrapes) without spending an LLM call.
+    title = result.get("title", "").strip()
+    snippet = result.get("snippet", "").strip()
+    url = result.get("url", "").strip()
+    if not url:
+        return 0.0
+    if not (title or snippet):
+        return 0.1
+    if len(title) + len(snippet) < 20:
+        combined = (title + snippet).lower()
+        if not any(term.lower() in combined for term in query.split()):
+            return 0.2
+
+    cache_key = _score_cache.make_key(query, result)
+    cached = _score_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    prompt = _render_relevance(
+        query,
+        result.get("title", ""),
+        result.get("url", ""),
+        result.get("snippet", ""),
     )
 
     response = await llm_router.complete(
@@ -70,19 +258,110 @@ async def score_relevance(
         return 0.5  # Default middle score
 
     try:
-        score = float(response.content.strip())
-        return max(0.0, min(1.0, score))  # Clamp to [0, 1]
+        score = max(0.0, min(1.0, float(response.content.strip())))  # Clamp to [0, 1]
+        _score_cache.set(cache_key, score)
+        return score
     except ValueError:
         logger.debug(f"Invalid relevance score: {response.content}")
         return 0.5
 
 
+FUSED_PROMPT = """Rate the relevance of this search result to the query AND summarize it.
+
+Query: {query}
+
+Result Title: {title}
+Result URL: {url}
+Result Snippet: {snippet}
+
+Score from 0.0 (completely irrelevant) to 1.0 (highly relevant); keep the
+summary to at most 3 sentences focused on the query.
+
+Respond with ONLY JSON: {{"score": 0.0, "summary": "..."}}"""
+
+_render_fused = _compile_prompt(FUSED_PROMPT, "query", "title", "url", "snippet")
+
+
+async def score_and_summarize(
+    query: str,
+    result: dict[str, Any],
+    llm_router: FreeLLMRouter,
+) -> tuple[float, str]:
+    """
+    Score and summarize a result in a single LLM round trip.
+
+    Fusing the two calls halves RTTs for pipelines that score then
+    summarize every kept result.
+
+    Returns:
+        (relevance score, summary) — summary is "" when unavailable
+    """
+    import json
+
+    from deadman_scraper.ai.llm_router import TaskType
+
+    prompt = _render_fused(
+        query,
+        result.get("title", ""),
+        result.get("url", ""),
+        result.get("snippet", ""),
+    )
+
+    response = await llm_router.complete(
+        prompt,
+        task_type=TaskType.RELEVANCE_SCORING,
+        max_tokens=200,
+        temperature=0.3,
+    )
+
+    if not response.success:
+        logger.debug(f"Fused score/summarize failed: {response.error}")
+        return 0.5, ""
+
+    try:
+        data = json.loads(_strip_json_fence(response.content))
+        score = max(0.0, min(1.0, float(data.get("score", 0.5))))
+        return score, str(data.get("summary", ""))
+    except (ValueError, json.JSONDecodeError):
+        logger.debug(f"Invalid fused response: {response.content}")
+        return 0.5, ""
+
+
+_WORD_RE = re.compile(r"\w+")
+
+# Lexical bands: results outside the middle band skip the LLM entirely.
+LEXICAL_ACCEPT = 0.8
+LEXICAL_REJECT = 0.15
+
+
+def _lexical_score(query: str, result: dict[str, Any]) -> float:
+    """
+    Cheap token-overlap score used to pre-filter results before LLM scoring.
+
+    Title matches weigh double since titles are the strongest relevance
+    signal in search output. Returns a value in [0, 1].
+    """
+    q_tokens = set(_WORD_RE.findall(query.lower()))
+    if not q_tokens:
+        return 0.5
+
+    title_tokens = set(_WORD_RE.findall(result.get("title", "").lower()))
+    snippet_tokens = set(_WORD_RE.findall(result.get("snippet", "").lower()))
+
+    title_hits = len(q_tokens & title_tokens)
+    snippet_hits = len(q_tokens & snippet_tokens)
+    score = (2.0 * title_hits + snippet_hits) / (2.0 * len(q_tokens))
+    return min(1.0, score)
+
+
 async def filter_relevant(
     query: str,
     results: list[dict[str, Any]],
     llm_router: FreeLLMRouter,
     threshold: float = 0.5,
     max_concurrent: int = 10,
+    top_k: int | None = None,
+    include_summaries: bool = False,
 ) -> list[dict[str, Any]]:
     """
     Filter search results by relevance score.
@@ -93,34 +372,125 @@ async def filter_relevant(
         llm_router: LLM router for scoring
         threshold: Minimum relevance score to keep
         max_concurrent: Max concurrent LLM calls
+        top_k: If set, stop scoring once the top K cannot change and
+            return only the K best results
+        include_summaries: Use the fused score+summarize call per result
+            and attach 'summary' alongside 'relevance_score'
 
     Returns:
         Filtered list of results with 'relevance_score' added
     """
-    semaphore = asyncio.Semaphore(max_concurrent)
-
-    async def score_with_limit(result: dict) -> tuple[dict, float]:
-        async with semaphore:
-            score = await score_relevance(query, result, llm_router)
-            return result, score
+    import heapq
+    import itertools
 
-    # Score all results concurrently
-    tasks = [score_with_limit(r) for r in results]
-    scored = await asyncio.gather(*tasks)
+    # Size concurrency to quota headroom: don't blow the day's remaining
+    # budget on one search, but open up when quota is plentiful.
+    try:
+        quota = llm_router.get_quota_status()
+        best_remaining = max((q["remaining"] for q in quota.values() if q), default=0)
+        expected_calls = max(1, -(-len(results) // BATCH_CHUNK_SIZE))
+        if best_remaining:
+            max_concurrent = max(2, min(max_concurrent, best_remaining // expected_calls))
+    except Exception:
+        pass  # Quota telemetry is best-effort; keep the caller's setting
 
-    # Filter and sort by relevance
-    filtered = []
-    for result, score in scored:
-        if score >= threshold:
-            result["relevance_score"] = score
-            filtered.append(result)
+    semaphore = asyncio.Semaphore(max_concurrent)
 
-    filtered.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
+    async def score_chunk_with_limit(chunk: list[dict]) -> list[tuple[dict, float]]:
+        async with semaphore:
+            if include_summaries:
+                # Fused path: one round trip yields score + summary per result
+                pairs = []
+                for result in chunk:
+                    score, summary = await score_and_summarize(query, result, llm_router)
+                    if summary:
+                        result["summary"] = summary
+                    pairs.append((result, score))
+                return pairs
+            scores = await _batch_score(query, chunk, llm_router)
+            return list(zip(chunk, scores))
+
+    # Cheap-filter-before-expensive-filter: resolve obvious accepts/rejects
+    # lexically and only escalate the borderline band to the LLM.
+    scored: list[tuple[dict, float]] = []
+    borderline: list[dict] = []
+    for result in results:
+        lexical = _lexical_score(query, result)
+        if lexical >= LEXICAL_ACCEPT or lexical <= LEXICAL_REJECT:
+            scored.append((result, lexical))
+        else:
+            borderline.append(result)
+
+    # Score borderline results in batched LLM calls — one round trip per
+    # chunk of BATCH_CHUNK_SIZE instead of one per result. Stream chunk
+    # completions instead of gathering so early results land immediately
+    # and, in top_k mode, the tail calls can be cancelled outright.
+    chunks = [borderline[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(borderline), BATCH_CHUNK_SIZE)]
+    tasks = [asyncio.create_task(score_chunk_with_limit(c)) for c in chunks]
+
+    if top_k is None:
+        for coro in asyncio.as_completed(tasks):
+            scored.extend(await coro)
+    else:
+        # Maintain a heap of the current top-K; once it is full and every
+        # pending chunk's lexical upper bound sits below the heap minimum,
+        # cancel the outstanding LLM calls — they cannot enter the top-K.
+        counter = itertools.count()  # tie-breaker so dicts never compare
+        heap: list[tuple[float, int, dict]] = []
+        for result, score in scored:
+            item = (score, next(counter), result)
+            if len(heap) < top_k:
+                heapq.heappush(heap, item)
+            else:
+                heapq.heappushpop(heap, item)
+
+        chunk_bounds = {
+            id(t): max((_lexical_score(query, r) for r in c), default=0.0)
+            for t, c in zip(tasks, chunks)
+        }
+        pending = set(tasks)
+        for coro in asyncio.as_completed(list(tasks)):
+            chunk_scored = await coro
+            pending = {t for t in pending if not t.done()}
+            for result, score in chunk_scored:
+                scored.append((result, score))
+                item = (score, next(counter), result)
+                if len(heap) < top_k:
+                    heapq.heappush(heap, item)
+                else:
+                    heapq.heappushpop(heap, item)
+            if len(heap) >= top_k and pending:
+                floor = heap[0][0]
+                if all(chunk_bounds[id(t)] <= floor for t in pending):
+                    for t in pending:
+                        t.cancel()
+                    break
+
+    # Filter and sort by relevance with one C-level argsort instead of a
+    # Python-comparison sort over dict lookups.
+    import numpy as np
+
+    scores = np.fromiter((s for _, s in scored), dtype=np.float32, count=len(scored))
+    keep = np.where(scores >= threshold)[0]
+    order = keep[np.argsort(-scores[keep], kind="stable")]
+    filtered = [
+        scored[i][0] | {"relevance_score": float(scores[i])}
+        for i in order
+    ]
+    if top_k is not None:
+        filtered = filtered[:top_k]
 
     logger.info(f"Filtered {len(results)} results to {len(filtered)} (threshold={threshold})")
     return filtered
 
 
+def _truncate(text: str, max_chars: int, suffix: str = "") -> str:
+    """Truncate text for prompt inclusion."""
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars] + suffix
+
+
 SUMMARY_PROMPT = """Summarize the following content concisely.
 
 Query context: {query}
@@ -130,6 +500,8 @@ Content:
 
 Provide a 2-3 sentence summary focusing on information relevant to the query."""
 
+_render_summary = _compile_prompt(SUMMARY_PROMPT, "query", "content")
+
 
 async def summarize_content(
     content: str,
@@ -151,10 +523,9 @@ async def summarize_content(
     from deadman_scraper.ai.llm_router import TaskType
 
     # Truncate very long content
-    if len(content) > 10000:
-        content = content[:10000] + "..."
+    content = _truncate(content, 10000, "...")
 
-    prompt = SUMMARY_PROMPT.format(query=query, content=content)
+    prompt = _render_summary(query, content)
 
     response = await llm_router.complete(
         prompt,
@@ -185,6 +556,45 @@ Extract and categorize:
 Format as JSON:
 {{"people": [], "organizations": [], "locations": [], "technologies": [], "dates": []}}"""
 
+_render_entity = _compile_prompt(ENTITY_PROMPT, "text")
+
+_ENTITY_CATEGORIES = ("people", "organizations", "locations", "technologies", "dates")
+
+try:
+    import msgspec
+
+    class _Entities(msgspec.Struct):
+        """Typed schema for LLM entity output — validates and fills defaults."""
+        people: list[str] = []
+        organizations: list[str] = []
+        locations: list[str] = []
+        technologies: list[str] = []
+        dates: list[str] = []
+
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+
+def _empty_entities() -> dict[str, list[str]]:
+    return {category: [] for category in _ENTITY_CATEGORIES}
+
+
+def _parse_entities(content: str) -> dict[str, list[str]]:
+    """
+    Parse the LLM's entity JSON, preferring msgspec's native decoder with
+    schema validation; falls back to stdlib json plus manual default fill.
+    """
+    import json
+
+    if HAS_MSGSPEC:
+        return msgspec.to_builtins(msgspec.json.decode(content, type=_Entities))
+
+    data = json.loads(content)
+    if not isinstance(data, dict):
+        raise ValueError("expected a JSON object")
+    return {category: list(data.get(category, [])) for category in _ENTITY_CATEGORIES}
+
 
 async def extract_entities(
     text: str,
@@ -200,15 +610,12 @@ async def extract_entities(
     Returns:
         Dict of entity categories to lists of entities
     """
-    import json
-
     from deadman_scraper.ai.llm_router import TaskType
 
     # Truncate
-    if len(text) > 5000:
-        text = text[:5000]
+    text = _truncate(text, 5000)
 
-    prompt = ENTITY_PROMPT.format(text=text)
+    prompt = _render_entity(text)
 
     response = await llm_router.complete(
         prompt,
@@ -218,17 +625,11 @@ async def extract_entities(
     )
 
     if not response.success:
-        return {"people": [], "organizations": [], "locations": [], "technologies": [], "dates": []}
+        return _empty_entities()
 
     try:
-        # Try to parse JSON from response
-        content = response.content.strip()
-        # Handle markdown code blocks
-        if "```" in content:
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-        return json.loads(content)
-    except (json.JSONDecodeError, IndexError):
+        # Parse JSON from the response, unwrapping any markdown code fence
+        return _parse_entities(_strip_json_fence(response.content))
+    except Exception:
         logger.debug(f"Failed to parse entities: {response.content}")
-        return {"people": [], "organizations": [], "locations": [], "technologies": [], "dates": []}
+        return _empty_entities()
@@ -0,0 +1,181 @@
+"""Content Store - SQLite-backed storage for scraped page content."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import zstandard as zstd
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+logger = logging.getLogger(__name__)
+
+
+class ContentStore:
+    """
+    SQLite-backed store for scraped page bodies.
+
+    One row per URL replaces one JSON file per URL: no per-page
+    open/close syscalls, no directory growth into millions of inodes,
+    and writes can be batched into a single transaction.
+    """
+
+    def __init__(self, db_path: str = "data/content.db"):
+        """
+        Initialize content store.
+
+        Args:
+            db_path: Path to SQLite database
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._cctx = zstd.ZstdCompressor(level=3) if HAS_ZSTD else None
+        self._dctx = zstd.ZstdDecompressor() if HAS_ZSTD else None
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize database tables."""
+        with self._get_conn() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    subdir TEXT NOT NULL,
+                    scraped_at REAL NOT NULL,
+                    status_code INTEGER,
+                    compression TEXT NOT NULL DEFAULT 'none',
+                    content BLOB NOT NULL,
+                    meta TEXT NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_pages_subdir ON pages(subdir)')
+            conn.commit()
+
+    @contextmanager
+    def _get_conn(self):
+        """Get a persistent per-thread database connection (WAL mode)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        yield conn
+
+    def put_many(self, rows: list[dict]):
+        """
+        Store a batch of pages in one transaction.
+
+        Each row dict needs: url, subdir, status_code, content (str),
+        meta (dict).
+        """
+        if not rows:
+            return
+
+        now = time.time()
+        prepared = []
+        for row in rows:
+            content = row['content'].encode('utf-8')
+            if self._cctx is not None:
+                content = self._cctx.compress(content)
+                compression = 'zstd'
+            else:
+                compression = 'none'
+            prepared.append((
+                row['url'],
+                row['subdir'],
+                now,
+                row.get('status_code'),
+                compression,
+                content,
+                json.dumps(row['meta']),
+            ))
+
+        with self._get_conn() as conn:
+            conn.executemany('''
+                INSERT OR REPLACE INTO pages
+                (url, subdir, scraped_at, status_code, compression, content, meta)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', prepared)
+            conn.commit()
+
+    def get(self, url: str) -> dict | None:
+        """Fetch one page with its content decompressed."""
+        with self._get_conn() as conn:
+            row = conn.execute(
+                "SELECT * FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return self._hydrate(row)
+
+    def iter_pages(self, subdir: str = None) -> Iterator[dict]:
+        """Yield stored pages, optionally filtered by subdir."""
+        with self._get_conn() as conn:
+            if subdir:
+                cursor = conn.execute(
+                    "SELECT * FROM pages WHERE subdir = ?", (subdir,)
+                )
+            else:
+                cursor = conn.execute("SELECT * FROM pages")
+            for row in cursor:
+                yield self._hydrate(row)
+
+    def iter_meta(self, subdir: str = None) -> Iterator[dict]:
+        """
+        Yield url/subdir/meta for stored pages without touching content.
+
+        Metadata consumers (e.g. URL extraction) skip the BLOB read and
+        decompression entirely this way.
+        """
+        with self._get_conn() as conn:
+            if subdir:
+                cursor = conn.execute(
+                    "SELECT url, subdir, meta FROM pages WHERE subdir = ?", (subdir,)
+                )
+            else:
+                cursor = conn.execute("SELECT url, subdir, meta FROM pages")
+            for row in cursor:
+                yield {
+                    'url': row['url'],
+                    'subdir': row['subdir'],
+                    'meta': json.loads(row['meta']),
+                }
+
+    def _hydrate(self, row: sqlite3.Row) -> dict:
+        """Turn a raw row into a dict with decompressed content."""
+        content = row['content']
+        if row['compression'] == 'zstd':
+            if self._dctx is None:
+                raise RuntimeError(
+                    "Page was stored zstd-compressed but zstandard is not installed"
+                )
+            content = self._dctx.decompress(content)
+        return {
+            'url': row['url'],
+            'subdir': row['subdir'],
+            'scraped_at': row['scraped_at'],
+            'status_code': row['status_code'],
+            'content': content.decode('utf-8'),
+            'meta': json.loads(row['meta']),
+        }
+
+    def count(self) -> int:
+        """Number of stored pages."""
+        with self._get_conn() as conn:
+            return conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def close(self):
+        """Close this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -78,6 +78,10 @@ class Engine:
         self._workers: list[asyncio.Task] = []
         self._results_queue: asyncio.Queue[ScrapeResult] = asyncio.Queue()
 
+        # Single-flight map: concurrent scrapes of the same URL share one fetch
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._inflight_lock = asyncio.Lock()
+
         # Component instances (lazy loaded)
         self._downloader = None
         self._browser_pool = None
@@ -202,8 +206,16 @@ class Engine:
             },
         )
 
-        # For single requests, process directly
-        return await self._process_request(request)
+        # For single requests, process directly — but coalesce concurrent
+        # identical URLs onto one in-flight fetch (request single-flighting)
+        async with self._inflight_lock:
+            task = self._inflight.get(url)
+            if task is None:
+                task = asyncio.create_task(self._process_request(request))
+                self._inflight[url] = task
+                task.add_done_callback(lambda _t, u=url: self._inflight.pop(u, None))
+
+        return await asyncio.shield(task)
 
     async def scrape_many(
         self,
@@ -356,6 +368,9 @@ class Engine:
 
         if not self._downloader:
             self._proxy_manager = ProxyManager(self.config)
+            # File ingest happens off-loop; large proxy files would
+            # otherwise stall every in-flight request at first use
+            await self._proxy_manager.load_proxy_file()
             self._downloader = AdaptiveDownloader(
                 self.config, self.signals, self._tor_manager, self._proxy_manager
             )
@@ -6,7 +6,7 @@ Implements the "Burst Mode" intelligence gathering logic.
 """
 
 import logging
-import secrets
+import random
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -46,8 +46,9 @@ class AutonomousMission:
         start_time = datetime.now()
         end_time = start_time + timedelta(minutes=params.max_duration_mins)
 
-        # 1. Discovery Phase
-        query = secrets.SystemRandom().choice(params.focus_areas)
+        # 1. Discovery Phase (topic pick isn't security-sensitive; the OS
+        # CSPRNG read per call was pure overhead)
+        query = random.choice(params.focus_areas)
         logger.info(f"Phase 1: Discovery | Target Vector: {query}")
 
         # 2. Intelligence Gathering
@@ -2,6 +2,8 @@
 
 import asyncio
 import json
+import queue
+import threading
 from collections import defaultdict
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
@@ -9,12 +11,32 @@ from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
 
+from xxhash import xxh3_64_intdigest
+
 from ..core.config import Config
+from ..core.content_store import ContentStore
 from ..core.deduplicator import DomainTracker
 from ..core.engine import Engine
 from ..core.persistent_queue import PersistentQueue
 from ..extract.url_extractor import URLExtractor
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dump_json(data, path: Path) -> None:
+    """Write pretty-printed JSON, via orjson's C encoder when available."""
+    if HAS_ORJSON:
+        path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
 
 @dataclass
 class ScrapeStats:
@@ -46,6 +68,14 @@ class ScrapeStats:
         }
 
 
+@dataclass
+class _BatchOps:
+    """Queue writes collected by a batch of scrape tasks, committed together."""
+    completions: list[dict] = field(default_factory=list)
+    failures: list[tuple[str, str]] = field(default_factory=list)
+    new_urls: list[tuple[list[str], str | None, int]] = field(default_factory=list)
+
+
 class RecursiveScraper:
     """
     Main orchestrator for recursive deep scraping.
@@ -88,15 +118,32 @@ class RecursiveScraper:
         self.domain_tracker = DomainTracker()
         self.stats = ScrapeStats()
 
+        # Content hashes of pages already written this session, so
+        # duplicate bodies don't get persisted twice
+        self._saved_content_hashes: set[int] = set()
+
         # Output setup
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        (self.output_dir / "content").mkdir(exist_ok=True)
         (self.output_dir / "results").mkdir(exist_ok=True)
 
+        # Scraped bodies live in a single SQLite store rather than one
+        # JSON file per URL (no per-page syscalls, no inode explosion)
+        self.content_store = ContentStore(str(self.output_dir / "content.db"))
+
+        # Background writer: content rows are compressed and stored off
+        # the event loop so a slow disk never stalls concurrent fetches
+        self._writer_q: queue.Queue = queue.Queue(maxsize=256)
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, daemon=True
+        )
+        self._writer_thread.start()
+
         # Domain filtering
         self.allowed_domains: set[str] | None = None
         self.blocked_domains: set[str] = set()
+        self._allowed_exact: frozenset[str] = frozenset()
+        self._allowed_suffix: tuple[str, ...] = ()
 
     async def run(
         self,
@@ -135,8 +182,9 @@ class RecursiveScraper:
 
         async with self.engine:
             while self.stats.total_scraped < max_pages:
-                # Get next batch
-                batch = self.queue.get_next_batch(
+                # Get next batch with depths in one query (avoids a
+                # per-URL get_depth SELECT below)
+                batch = self.queue.get_next_batch_with_depth(
                     n=concurrency,
                     max_per_domain=3
                 )
@@ -146,34 +194,42 @@ class RecursiveScraper:
                     break
 
                 # Check depth limits
-                batch = [
-                    url for url in batch
-                    if self.queue.get_depth(url) < max_depth
-                ]
+                batch = [(url, depth) for url, depth in batch if depth < max_depth]
 
                 if not batch:
                     continue
 
-                # Scrape batch in parallel
+                # Scrape batch in parallel; tasks record their queue
+                # writes into ops so the whole batch commits once
+                ops = _BatchOps()
                 tasks = [
                     self._scrape_and_extract(
                         url,
+                        depth=depth,
                         max_depth=max_depth,
                         use_tor=use_tor,
-                        save_content=save_content
+                        save_content=save_content,
+                        ops=ops
                     )
-                    for url in batch
+                    for url, depth in batch
                 ]
 
                 await asyncio.gather(*tasks, return_exceptions=True)
 
+                self.stats.total_urls_added += self.queue.batch_apply(
+                    completions=ops.completions,
+                    failures=ops.failures,
+                    new_urls=ops.new_urls,
+                )
+
                 # Progress report
                 self._report_progress(progress_callback)
 
                 # Small delay between batches
                 await asyncio.sleep(0.5)
 
-        # Save final stats
+        # Save final stats (after all pending content writes land)
+        self._flush_writes()
         self._save_stats()
 
         return self.stats
@@ -199,66 +255,80 @@ class RecursiveScraper:
 
         async with self.engine:
             while self.stats.total_scraped < max_pages:
-                batch = self.queue.get_next_batch(n=concurrency, max_per_domain=3)
+                batch = self.queue.get_next_batch_with_depth(n=concurrency, max_per_domain=3)
 
                 if not batch:
                     break
 
-                batch = [
-                    url for url in batch
-                    if self.queue.get_depth(url) < max_depth
-                ]
+                batch = [(url, depth) for url, depth in batch if depth < max_depth]
 
                 if not batch:
                     continue
 
-                for url in batch:
+                for url, depth in batch:
+                    ops = _BatchOps()
                     result = await self._scrape_and_extract(
                         url,
+                        depth=depth,
                         max_depth=max_depth,
                         use_tor=use_tor,
-                        save_content=True
+                        save_content=True,
+                        ops=ops
+                    )
+                    # Streaming yields per URL, so writes apply per URL too
+                    self.stats.total_urls_added += self.queue.batch_apply(
+                        completions=ops.completions,
+                        failures=ops.failures,
+                        new_urls=ops.new_urls,
                     )
                     if result:
                         yield result
 
                 await asyncio.sleep(0.5)
 
+        self._flush_writes()
+
     async def _scrape_and_extract(
         self,
         url: str,
+        depth: int,
         max_depth: int,
         use_tor: bool,
-        save_content: bool
+        save_content: bool,
+        ops: _BatchOps
     ) -> dict | None:
         """
         Scrape a URL and extract new URLs.
 
+        Queue writes are recorded into `ops` rather than committed here,
+        so the caller can apply a whole batch in one transaction.
+
         Args:
             url: URL to scrape
+            depth: Depth of the URL (known by the batch query)
             max_depth: Maximum depth limit
             use_tor: Force TOR routing
             save_content: Save content to file
+            ops: Collector for this batch's queue writes
 
         Returns:
             Result dict or None on error
         """
-        depth = self.queue.get_depth(url)
         domain = urlparse(url).netloc
 
         try:
             # Check domain filters
             if self.allowed_domains and domain not in self.allowed_domains:
-                self.queue.mark_failed(url, "Domain not in allowed list")
+                ops.failures.append((url, "Domain not in allowed list"))
                 return None
 
             if domain in self.blocked_domains:
-                self.queue.mark_failed(url, "Domain blocked")
+                ops.failures.append((url, "Domain blocked"))
                 return None
 
             # Check domain health
             if self.domain_tracker.should_skip(url, min_success_rate=0.1):
-                self.queue.mark_failed(url, "Domain has too many failures")
+                ops.failures.append((url, "Domain has too many failures"))
                 return None
 
             # Scrape
@@ -286,30 +356,25 @@ class RecursiveScraper:
                     new_urls = self.extractor.extract_all(result.content, url)
                     self.stats.total_urls_found += len(new_urls)
 
-                    # Filter and add to queue
+                    # Filter and enqueue with the rest of the batch
                     if depth + 1 < max_depth:
                         filtered_urls = self._filter_urls(new_urls)
-                        added = self.queue.add_urls(
-                            filtered_urls,
-                            parent_url=url,
-                            depth=depth + 1
-                        )
-                        self.stats.total_urls_added += added
-                        new_urls_count = added
+                        ops.new_urls.append((filtered_urls, url, depth + 1))
+                        new_urls_count = len(filtered_urls)
 
                     # Save content
                     if save_content:
-                        self._save_content(url, result, new_urls)
+                        self._save_content(url, result, new_urls, domain)
 
                 # Mark complete
-                self.queue.mark_complete(
-                    url,
-                    status_code=result.status_code,
-                    content_type=result.content_type,
-                    content_length=len(result.content) if result.content else 0,
-                    fetch_layer=result.fetch_layer,
-                    extracted_urls=new_urls_count
-                )
+                ops.completions.append({
+                    'url': url,
+                    'status_code': result.status_code,
+                    'content_type': result.content_type,
+                    'content_length': len(result.content) if result.content else 0,
+                    'fetch_layer': result.fetch_layer,
+                    'extracted_urls': new_urls_count,
+                })
 
                 return {
                     'url': url,
@@ -326,7 +391,7 @@ class RecursiveScraper:
                 self.stats.total_failed += 1
                 self.stats.errors.append(f"{url}: {result.error}")
                 self.domain_tracker.record(url, False)
-                self.queue.mark_failed(url, result.error)
+                ops.failures.append((url, result.error))
 
                 return {
                     'url': url,
@@ -339,7 +404,7 @@ class RecursiveScraper:
             self.stats.total_failed += 1
             error_msg = str(e)
             self.stats.errors.append(f"{url}: {error_msg}")
-            self.queue.mark_failed(url, error_msg)
+            ops.failures.append((url, error_msg))
 
             return {
                 'url': url,
@@ -351,19 +416,29 @@ class RecursiveScraper:
     def _filter_urls(self, urls: list[str]) -> list[str]:
         """Filter URLs based on domain restrictions."""
         filtered = []
+        deduper = self.queue.deduper
 
         for url in urls:
             try:
-                parsed = urlparse(url)
-                domain = parsed.netloc.lower()
+                # Drop already-seen URLs here so duplicates never reach
+                # the queue's parse/priority/insert path (the fingerprint
+                # is cached, so the queue's own dedup pass stays cheap)
+                if deduper.is_duplicate(url):
+                    continue
+
+                # Extractor output is normalized scheme://host/... form,
+                # so slicing beats a full urlparse here
+                domain = url.split('/', 3)[2].lower()
 
                 # Skip blocked domains
                 if domain in self.blocked_domains:
                     continue
 
-                # Check allowed domains
-                if self.allowed_domains:
-                    if not any(d in domain for d in self.allowed_domains):
+                # Check allowed domains: exact host or dotted-suffix
+                # match, both C-level checks instead of an O(allowed)
+                # substring scan per URL
+                if self.allowed_domains is not None:
+                    if domain not in self._allowed_exact and not domain.endswith(self._allowed_suffix):
                         continue
 
                 filtered.append(url)
@@ -373,45 +448,83 @@ class RecursiveScraper:
 
         return filtered
 
-    def _save_content(self, url: str, result, extracted_urls: list[str]):
-        """Save scraped content to file."""
-        from hashlib import md5
-
-        try:
-            # Create filename from URL hash
-            url_hash = md5(url.encode(), usedforsecurity=False).hexdigest()[:16]  # nosec
-            domain = urlparse(url).netloc.replace('.', '_')
-
-            # Determine subdirectory based on domain type
-            if '.onion' in url:
-                subdir = "onion"
-            elif 'github.com' in url:
-                subdir = "github"
-            elif 'reddit.com' in url:
-                subdir = "reddit"
-            else:
-                subdir = "other"
+    # Rows per transaction in the background writer
+    WRITE_BATCH_SIZE = 50
 
-            output_subdir = self.output_dir / "content" / subdir
-            output_subdir.mkdir(exist_ok=True)
+    def _save_content(self, url: str, result, extracted_urls: list[str], domain: str):
+        """Queue scraped content for storage.
 
-            # Save JSON with metadata
-            output_file = output_subdir / f"{domain}_{url_hash}.json"
-            data = {
-                'url': url,
-                'scraped_at': datetime.now().isoformat(),
-                'status_code': result.status_code,
+        `domain` is the netloc the caller already parsed, so the URL
+        isn't parsed a second time here.
+        """
+        # Zero-value pages: nothing to persist
+        if not result.content:
+            return
+
+        # Duplicate bodies (mirrors, boilerplate 404s) cost a full row
+        # write each; one 8-byte hash probe skips them
+        content_hash = xxh3_64_intdigest(result.content.encode())
+        if content_hash in self._saved_content_hashes:
+            return
+        self._saved_content_hashes.add(content_hash)
+
+        # Categorize by domain type
+        if '.onion' in url:
+            subdir = "onion"
+        elif 'github.com' in url:
+            subdir = "github"
+        elif 'reddit.com' in url:
+            subdir = "reddit"
+        else:
+            subdir = "other"
+
+        # Compression and the SQLite write happen on the writer thread,
+        # so the event loop only pays for building the dict
+        self._writer_q.put({
+            'url': url,
+            'subdir': subdir,
+            'status_code': result.status_code,
+            'content': result.content,
+            'meta': {
                 'content_type': result.content_type,
                 'fetch_layer': result.fetch_layer,
-                'content': result.content,
                 'extracted_urls': extracted_urls[:100],  # Limit stored URLs
                 'extracted_count': len(extracted_urls),
-            }
+            },
+        })
+
+    def _writer_loop(self):
+        """Drain the write queue into the content store in batches."""
+        while True:
+            item = self._writer_q.get()
+            if item is None:
+                self._writer_q.task_done()
+                return
+
+            # Coalesce whatever is queued (up to a cap) into one
+            # transaction instead of committing per page
+            batch = [item]
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                try:
+                    extra = self._writer_q.get_nowait()
+                except queue.Empty:
+                    break
+                if extra is None:
+                    self._writer_q.put(None)
+                    break
+                batch.append(extra)
 
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Failed to save content for {url}: {e}")
+            try:
+                self.content_store.put_many(batch)
+            except Exception as e:
+                print(f"Failed to store {len(batch)} pages: {e}")
+            finally:
+                for _ in batch:
+                    self._writer_q.task_done()
+
+    def _flush_writes(self):
+        """Block until every queued page has been committed."""
+        self._writer_q.join()
 
     def _save_stats(self):
         """Save session statistics."""
@@ -424,8 +537,7 @@ class RecursiveScraper:
             'saved_at': datetime.now().isoformat(),
         }
 
-        with open(stats_file, 'w', encoding='utf-8') as f:
-            json.dump(combined_stats, f, indent=2)
+        _dump_json(combined_stats, stats_file)
 
     def _report_progress(self, callback: callable = None):
         """Report progress."""
@@ -465,26 +577,22 @@ class RecursiveScraper:
         """
         if allowed:
             self.allowed_domains = set(d.lower() for d in allowed)
+            self._allowed_exact = frozenset(self.allowed_domains)
+            self._allowed_suffix = tuple('.' + d for d in self.allowed_domains)
         else:
             self.allowed_domains = None
+            self._allowed_exact = frozenset()
+            self._allowed_suffix = ()
 
         if blocked:
             self.blocked_domains = set(d.lower() for d in blocked)
 
     def get_extracted_urls(self) -> list[str]:
         """Get all URLs extracted during the session."""
-        urls = []
-        content_dir = self.output_dir / "content"
-
-        for json_file in content_dir.rglob("*.json"):
-            try:
-                with open(json_file, encoding='utf-8') as f:
-                    data = json.load(f)
-                    urls.extend(data.get('extracted_urls', []))
-            except Exception:
-                continue
-
-        return list(set(urls))
+        # Every extracted URL that passed filtering already lives in the
+        # SQLite queue; one indexed query replaces walking and re-parsing
+        # every content JSON file (and isn't capped at 100 URLs per page)
+        return self.queue.export_urls()
 
     def export_results(self, format: str = 'json') -> str:
         """
@@ -496,28 +604,33 @@ class RecursiveScraper:
         Returns:
             Path to exported file
         """
-        results = self.queue.get_all_results()
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
         if format == 'json':
             output_file = self.output_dir / f"results_{timestamp}.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2)
+            _dump_json(self.queue.get_all_results(), output_file)
 
         elif format == 'urls':
+            # Stream rows straight to disk instead of building the full
+            # result list (and a joined string) in memory
             output_file = self.output_dir / f"urls_{timestamp}.txt"
-            urls = [r['url'] for r in results if r.get('status_code') == 200]
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(urls))
+                f.writelines(
+                    f"{r['url']}\n" for r in self.queue.iter_results()
+                    if r.get('status_code') == 200
+                )
 
         elif format == 'csv':
             output_file = self.output_dir / f"results_{timestamp}.csv"
             import csv
-            if results:
+            import itertools
+            rows = self.queue.iter_results()
+            first = next(rows, None)
+            if first:
                 with open(output_file, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=results[0].keys())
+                    writer = csv.DictWriter(f, fieldnames=first.keys())
                     writer.writeheader()
-                    writer.writerows(results)
+                    writer.writerows(itertools.chain([first], rows))
 
         return str(output_file)
 
@@ -9,8 +9,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+import sys
+import time
+from bisect import bisect_left
+from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -20,14 +24,32 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# slots=True: no per-instance __dict__, which matters when aggregator
+# files load 100k proxies
+@dataclass(slots=True)
 class ProxyHealth:
     url: str
     type: str
     success_count: int = 0
     fail_count: int = 0
-    last_used: datetime | None = None
+    # time.monotonic() of the last pick - a float beats a datetime
+    # allocation on the selection hot path
+    last_used: float | None = None
     is_blocked: bool = False
+    # Circuit-breaker state: a blocked proxy sits out until
+    # cooldown_until (monotonic), with the penalty escalating on
+    # repeated blocks instead of losing the IP forever
+    cooldown_until: float = 0.0
+    cooldown_level: int = 0
+    # Exponentially weighted moving averages of response latency and
+    # success rate, fed by report_success/report_failure
+    ewma_latency: float = 1.0
+    ewma_success: float = 1.0
+
+    @property
+    def weight(self) -> float:
+        """Selection weight: fast, reliable proxies attract more traffic."""
+        return self.ewma_success / max(self.ewma_latency, 1e-3)
 
 
 class ProxyManager:
@@ -36,50 +58,135 @@ class ProxyManager:
     NASA Standards: Highly modular, fault-tolerant.
     """
 
+    # EWMA smoothing factor for latency/success updates
+    EWMA_ALPHA = 0.2
+    # Health reports tolerated before the cumulative weight table is
+    # rebuilt (selection stays O(log N) between rebuilds)
+    REBUILD_AFTER_REPORTS = 32
+    # Escalating cooldowns for blocked proxies; the last entry repeats
+    COOLDOWN_STEPS = (30.0, 120.0, 300.0, 600.0)
+
     def __init__(self, config: Config):
         self.config = config
         self.proxies: dict[str, ProxyHealth] = {}
-        self.current_index = 0
+        # Healthy proxies bucketed by type, mutated in place on health
+        # reports, so selection never rescans the full pool
+        self._healthy: dict[str, list[ProxyHealth]] = defaultdict(list)
+        # Blocked proxies waiting out their cooldown, moved back into
+        # _healthy by get_proxy once the timer expires
+        self._cooling: dict[str, list[ProxyHealth]] = defaultdict(list)
+        # Cumulative weight tables per type, rebuilt lazily; a slow or
+        # flaky proxy attracts progressively less traffic than a fast one
+        self._cum_weights: dict[str, list[float]] = {}
+        self._stale_reports: dict[str, int] = defaultdict(int)
+        self._rng = random.Random()
+        # The proxy file is ingested lazily (or via load_proxy_file from
+        # async code) so constructing the manager never blocks on disk
+        self._file_loaded = not (
+            config.proxy.enabled and config.proxy.proxy_file
+        )
         self._load_proxies()
 
+    def _add_proxy(self, p_url: str):
+        """Register a proxy and place it in its healthy bucket."""
+        # Interned URLs make the dict lookups in report_success/failure
+        # pointer comparisons instead of char-by-char equality
+        p_url = sys.intern(p_url)
+        health = ProxyHealth(url=p_url, type=self.config.proxy.type)
+        self.proxies[p_url] = health
+        self._healthy[health.type].append(health)
+
     def _load_proxies(self):
-        """Load proxies from config or files."""
+        """Load proxies listed directly in the config."""
         if not self.config.proxy.enabled:
             return
 
-        # Load from list in config
         for p_url in self.config.proxy.proxy_list:
-            self.proxies[p_url] = ProxyHealth(url=p_url, type=self.config.proxy.type)
-
-        # Load from proxy_file
-        if self.config.proxy.proxy_file:
-            path = Path(self.config.proxy.proxy_file)
-            if path.exists():
-                with open(path, encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            self.proxies[line] = ProxyHealth(url=line, type=self.config.proxy.type)
+            self._add_proxy(p_url)
+
+    def _ingest_file(self):
+        """
+        Bulk-ingest the proxy file: one read, one splitlines, duplicates
+        collapsed up front. Proxy files routinely run to 100k lines, so
+        per-line strip/insert loops are worth avoiding.
+        """
+        path = Path(self.config.proxy.proxy_file)
+        if not path.exists():
+            return
+
+        lines = path.read_bytes().decode('utf-8', 'ignore').splitlines()
+        entries = dict.fromkeys(line.strip() for line in lines)
+        for entry in entries:
+            if entry and not entry.startswith('#') and entry not in self.proxies:
+                self._add_proxy(entry)
+
+    def _ensure_file_loaded(self):
+        """Synchronous fallback for callers off the event loop."""
+        if not self._file_loaded:
+            self._file_loaded = True
+            self._ingest_file()
+
+    async def load_proxy_file(self):
+        """Ingest the proxy file without blocking the event loop."""
+        if not self._file_loaded:
+            self._file_loaded = True
+            await asyncio.to_thread(self._ingest_file)
+
+    def _invalidate_weights(self, key: str):
+        """Force a weight-table rebuild on the next selection."""
+        self._cum_weights.pop(key, None)
+        self._stale_reports[key] = 0
+
+    def _weight_table(self, key: str, bucket: list[ProxyHealth]) -> list[float]:
+        """Get the cumulative weight table for a bucket, rebuilding lazily."""
+        cum = self._cum_weights.get(key)
+        if cum is None or self._stale_reports[key] >= self.REBUILD_AFTER_REPORTS:
+            total = 0.0
+            cum = []
+            for p in bucket:
+                total += p.weight
+                cum.append(total)
+            self._cum_weights[key] = cum
+            self._stale_reports[key] = 0
+        return cum
+
+    def _restore_cooled(self, key: str):
+        """Move proxies whose cooldown has expired back into rotation."""
+        cooling = self._cooling.get(key)
+        if not cooling:
+            return
+        now = time.monotonic()
+        still_cooling = [p for p in cooling if now < p.cooldown_until]
+        if len(still_cooling) != len(cooling):
+            for p in cooling:
+                if now >= p.cooldown_until:
+                    p.is_blocked = False
+                    self._healthy[key].append(p)
+            self._cooling[key] = still_cooling
+            self._invalidate_weights(key)
 
     def get_proxy(self, proxy_type: str | None = None) -> str | None:
-        """Get next healthy proxy in rotation."""
-        if not self.config.proxy.enabled or not self.proxies:
+        """Get a healthy proxy, weighted by EWMA latency and success rate."""
+        if not self.config.proxy.enabled:
             return None
 
-        healthy_proxies = [
-            p for p in self.proxies.values()
-            if not p.is_blocked and (proxy_type is None or p.type == proxy_type)
-        ]
+        self._ensure_file_loaded()
+        if not self.proxies:
+            return None
 
-        if not healthy_proxies:
+        key = proxy_type or self.config.proxy.type
+        self._restore_cooled(key)
+        bucket = self._healthy[key]
+        if not bucket:
             logger.warning(f"No healthy proxies available for type: {proxy_type}")
             return None
 
-        # Round-robin rotation among healthy proxies
-        selected = healthy_proxies[self.current_index % len(healthy_proxies)]
-        self.current_index += 1
+        # Weighted pick: O(log N) bisect into the cumulative table
+        cum = self._weight_table(key, bucket)
+        idx = bisect_left(cum, self._rng.random() * cum[-1])
+        selected = bucket[min(idx, len(bucket) - 1)]
 
-        selected.last_used = datetime.now()
+        selected.last_used = time.monotonic()
         return selected.url
 
     async def renew_tor_circuit(self):
@@ -96,16 +203,55 @@ class ProxyManager:
         except Exception as e:
             logger.error(f"[TOR] Identity renewal failed: {e}")
 
-    def report_success(self, proxy_url: str):
+    def report_success(self, proxy_url: str, latency: float | None = None):
         """Record a successful request with a proxy."""
-        if proxy_url in self.proxies:
-            self.proxies[proxy_url].success_count += 1
-            self.proxies[proxy_url].is_blocked = False
+        p = self.proxies.get(proxy_url)
+        if p is not None:
+            p.success_count += 1
+            a = self.EWMA_ALPHA
+            p.ewma_success = a * 1.0 + (1 - a) * p.ewma_success
+            if latency is not None:
+                p.ewma_latency = a * latency + (1 - a) * p.ewma_latency
+            self._stale_reports[p.type] += 1
+            # A success closes the breaker: the next block starts the
+            # cooldown escalation from the bottom again
+            p.cooldown_level = 0
+            if p.is_blocked:
+                # Proved itself again (e.g. an in-flight request landed
+                # mid-cooldown) - back into rotation early
+                p.is_blocked = False
+                p.cooldown_until = 0.0
+                cooling = self._cooling[p.type]
+                if p in cooling:
+                    cooling.remove(p)
+                self._healthy[p.type].append(p)
+                self._invalidate_weights(p.type)
 
     def report_failure(self, proxy_url: str, is_block: bool = False):
         """Record a failed request with a proxy."""
-        if proxy_url in self.proxies:
-            self.proxies[proxy_url].fail_count += 1
-            if is_block:
-                self.proxies[proxy_url].is_blocked = True
-                logger.info(f"Proxy marked as blocked: {proxy_url}")
+        p = self.proxies.get(proxy_url)
+        if p is not None:
+            p.fail_count += 1
+            p.ewma_success = (1 - self.EWMA_ALPHA) * p.ewma_success
+            self._stale_reports[p.type] += 1
+            if is_block and not p.is_blocked:
+                p.is_blocked = True
+                p.cooldown_level += 1
+                step = self.COOLDOWN_STEPS[
+                    min(p.cooldown_level - 1, len(self.COOLDOWN_STEPS) - 1)
+                ]
+                p.cooldown_until = time.monotonic() + step
+                bucket = self._healthy[p.type]
+                try:
+                    # Order is irrelevant, so swap-with-last makes the
+                    # removal O(1) instead of shifting the tail
+                    i = bucket.index(p)
+                    bucket[i] = bucket[-1]
+                    bucket.pop()
+                except ValueError:
+                    pass
+                self._cooling[p.type].append(p)
+                self._invalidate_weights(p.type)
+                logger.info(
+                    "Proxy cooling down %.0fs: %s", step, proxy_url
+                )
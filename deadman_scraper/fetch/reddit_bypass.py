@@ -16,20 +16,41 @@ Bypass Strategies:
 """
 
 import asyncio
-import secrets
+import base64
+import logging
+import random
+import re
 import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any
+from urllib.parse import urljoin
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes via orjson's C parser when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
+
+
+@dataclass(slots=True)
 class RedditConfig:
     """Reddit scraping configuration."""
     # Timing
     min_delay: float = 2.0  # Min seconds between requests
     max_delay: float = 5.0  # Max seconds between requests
     rate_limit_backoff: float = 60.0  # Wait on 429
+    burst_capacity: int = 5  # Token-bucket burst size
 
     # Endpoints
     use_old_reddit: bool = True  # old.reddit.com has less protection
@@ -39,6 +60,10 @@ class RedditConfig:
     use_tor: bool = False
     tor_rotate_on_429: bool = True
 
+    # Racing: dispatch this many concurrent attempts through different
+    # proxies, keep the first success, cancel the rest (1 = off)
+    race_k: int = 1
+
     # OAuth (for API)
     client_id: str | None = None
     client_secret: str | None = None
@@ -56,8 +81,53 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
 ]
 
-
-@dataclass
+# A few plausible Accept-Language variants, rotated independently of
+# the UA so header fingerprints vary request to request
+_ACCEPT_LANGUAGES = (
+    "en-US,en;q=0.5",
+    "en-US,en;q=0.9",
+    "en-GB,en-US;q=0.9,en;q=0.8",
+    "en-US,en;q=0.7,*;q=0.3",
+)
+
+_BASE_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0",
+}
+
+# One frozen header dict per (UA, language) pair, built once: rotating
+# references beats allocating a fresh 13-key dict on every request
+_HEADER_TEMPLATES = tuple(
+    tuple(
+        {"User-Agent": ua, "Accept-Language": lang, **_BASE_HEADERS}
+        for lang in _ACCEPT_LANGUAGES
+    )
+    for ua in USER_AGENTS
+)
+
+# URL transform patterns, compiled once. The lookbehind keeps an
+# already-transformed host from becoming old.old.reddit.com (which the
+# old chained str.replace calls actually produced).
+_HOST_RE = re.compile(r'(?<!old\.)\b(?:www\.)?reddit\.com')
+_QSPLIT_RE = re.compile(r'\?')
+
+# Jitter and UA rotation aren't security-sensitive; one shared PRNG
+# avoids instantiating a fresh SystemRandom (an os.urandom read) per
+# request
+_RNG = random.Random()
+
+
+# slots=True: slot lookups beat __dict__ lookups on counters bumped
+# once per request, and drop the per-instance dict
+@dataclass(slots=True)
 class RequestStats:
     """Track request statistics."""
     total_requests: int = 0
@@ -77,77 +147,232 @@ class RedditBypass:
         content = await bypass.fetch("https://reddit.com/r/python")
     """
 
-    def __init__(self, config: RedditConfig = None, tor_manager=None):
+    def __init__(self, config: RedditConfig = None, tor_manager=None, proxy_manager=None):
         self.config = config or RedditConfig()
         self.tor = tor_manager
+        self.proxy_manager = proxy_manager
         self.stats = RequestStats()
-        self._oauth_token: str | None = None
-        self._token_expiry: datetime | None = None
-        self._current_ua = secrets.choice(USER_AGENTS)
+        # UA deck: every request draws the next card, reshuffled when
+        # exhausted, so Reddit never sees a long same-UA run
+        self._ua_deck = list(range(len(USER_AGENTS)))
+        _RNG.shuffle(self._ua_deck)
+        self._ua_pos = 0
+        self._ua_idx = self._ua_deck[0]
+        self._lang_idx = _RNG.randrange(len(_ACCEPT_LANGUAGES))
+        # Token bucket shared by every in-flight coroutine; refills at
+        # 1/min_delay so true QPS stays inside Reddit's budget
+        self._bucket_tokens = float(self.config.burst_capacity)
+        self._bucket_last = time.monotonic()
+        self._bucket_lock = asyncio.Lock()
+        # One pooled client per proxy (None = direct), reused across all
+        # fetches: keep-alive skips the TCP+TLS handshake per request
+        self._clients: dict[str | None, Any] = {}
+        # Short-TTL response cache: a repeat listing hit skips the whole
+        # request round-trip including the mandatory rate-limit sleep
+        self._cache: dict[str, tuple[float, str]] = {}
+        self._cache_freq: dict[str, int] = {}
+
+        # Single-flight map: URL -> in-flight fetch task
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    # Response cache sizing / TTLs (seconds)
+    CACHE_MAX_ENTRIES = 512
+    CACHE_TTL_NEW = 15.0       # /new churns fast
+    CACHE_TTL_SLOW = 300.0     # /top and search barely move
+    CACHE_TTL_DEFAULT = 30.0
+
+    def _cache_ttl(self, url: str) -> float:
+        """TTL for a transformed URL, derived from the endpoint."""
+        if '/new' in url:
+            return self.CACHE_TTL_NEW
+        if '/top' in url or '/search' in url:
+            return self.CACHE_TTL_SLOW
+        return self.CACHE_TTL_DEFAULT
+
+    def _cache_get(self, url: str, allow_stale: bool = False) -> str | None:
+        """Return cached content if fresh (or stale when allowed)."""
+        entry = self._cache.get(url)
+        if entry is None:
+            return None
+        ts, content = entry
+        if allow_stale or time.time() - ts < self._cache_ttl(url):
+            self._cache_freq[url] = self._cache_freq.get(url, 0) + 1
+            return content
+        return None
 
-    def _get_headers(self) -> dict[str, str]:
-        """Generate realistic browser headers."""
-        return {
-            "User-Agent": self._current_ua,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Cache-Control": "max-age=0",
+    def _cache_put(self, url: str, content: str):
+        """Insert into the cache, evicting the least-frequently-used entry."""
+        if url not in self._cache and len(self._cache) >= self.CACHE_MAX_ENTRIES:
+            victim = min(self._cache, key=lambda k: self._cache_freq.get(k, 0))
+            del self._cache[victim]
+            self._cache_freq.pop(victim, None)
+        self._cache[url] = (time.time(), content)
+        self._cache_freq.setdefault(url, 0)
+
+    def _client(self, proxy: str | None = None):
+        """Get (or create) the pooled client for a proxy."""
+        import httpx
+
+        client = self._clients.get(proxy)
+        if client is None:
+            kwargs = dict(
+                proxy=proxy,
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=64,
+                    keepalive_expiry=30.0,
+                ),
+                timeout=httpx.Timeout(30.0),
+                # _transform_url already targets the right host, so
+                # auto-following reddit's www<->old 301s would just buy
+                # an extra round-trip; fetch follows 3xx manually
+                follow_redirects=False,
+            )
+            try:
+                client = httpx.AsyncClient(http2=True, **kwargs)
+            except ImportError:
+                # h2 not installed - HTTP/1.1 keep-alive still pools
+                client = httpx.AsyncClient(**kwargs)
+            self._clients[proxy] = client
+        return client
+
+    async def aclose(self):
+        """Close all pooled connections."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+    def _pick_proxy(self) -> str | None:
+        """Pick a proxy for one attempt."""
+        if self.proxy_manager is not None:
+            return self.proxy_manager.get_proxy()
+        if self.config.use_tor and self.tor:
+            return self.tor.proxy_url
+        return None
+
+    async def _one_shot(self, url: str, proxy: str | None, headers: dict, timeout: float):
+        """Single GET through one proxy; returns (response, proxy)."""
+        client = self._client(proxy)
+        response = await client.get(url, headers=headers, timeout=timeout)
+        return response, proxy
+
+    async def _race(self, url: str, headers: dict, timeout: float):
+        """
+        Dispatch race_k concurrent attempts through different proxies
+        and return the first 2xx/3xx (response, proxy), cancelling the
+        losers. A single slow or blocked proxy no longer costs a full
+        timeout of dead wall time.
+        """
+        pending = {
+            asyncio.create_task(
+                self._one_shot(url, self._pick_proxy(), headers, timeout)
+            )
+            for _ in range(self.config.race_k)
         }
+        fallback = (None, None)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        continue
+                    response, proxy = task.result()
+                    if response.status_code < 400:
+                        return response, proxy
+                    # Remember one error response in case nothing wins
+                    if fallback[0] is None:
+                        fallback = (response, proxy)
+            return fallback
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @property
+    def _current_ua(self) -> str:
+        """The User-Agent currently in rotation."""
+        return USER_AGENTS[self._ua_idx]
+
+    def _get_headers(self) -> dict[str, str]:
+        """Realistic browser headers, rotated per request from the deck."""
+        idx = self._ua_deck[self._ua_pos]
+        self._ua_pos += 1
+        if self._ua_pos == len(self._ua_deck):
+            self._ua_pos = 0
+            _RNG.shuffle(self._ua_deck)
+        self._ua_idx = idx
+        self._lang_idx = (self._lang_idx + 1) % len(_ACCEPT_LANGUAGES)
+        return _HEADER_TEMPLATES[idx][self._lang_idx]
 
     def _transform_url(self, url: str) -> str:
         """Transform URL for better success rate."""
+        if not (self.config.use_old_reddit or self.config.prefer_json):
+            return url
+
         # Use old.reddit.com
         if self.config.use_old_reddit:
-            url = url.replace("www.reddit.com", "old.reddit.com")
-            url = url.replace("reddit.com", "old.reddit.com")
+            url = _HOST_RE.sub("old.reddit.com", url, count=1)
 
         # Append .json for structured data (if not search)
         if self.config.prefer_json and "/search" not in url and not url.endswith(".json"):
-            if "?" in url:
-                url = url.replace("?", ".json?")
-            else:
-                url = url.rstrip("/") + ".json"
+            spliced, n = _QSPLIT_RE.subn(".json?", url, count=1)
+            url = spliced if n else url.rstrip("/") + ".json"
 
         return url
 
     async def _wait_for_rate_limit(self):
-        """Wait appropriate time between requests."""
-        if self.stats.last_request:
-            elapsed = time.time() - self.stats.last_request
-            min_wait = self.config.min_delay
-
-            # Longer wait after 429
-            if self.stats.last_429 and time.time() - self.stats.last_429 < 300:
-                min_wait = max(min_wait, 10.0)
+        """
+        Token-bucket pacing shared across concurrent fetches.
 
-            if elapsed < min_wait:
-                wait = secrets.SystemRandom().uniform(min_wait, self.config.max_delay)
-                await asyncio.sleep(wait - elapsed)
+        The old single-timestamp check let N concurrent coroutines all
+        observe the same elapsed time, sleep identically, and then hit
+        Reddit as a burst. The bucket serializes token grants under a
+        lock, so aggregate QPS is bounded no matter the concurrency.
+        """
+        min_delay = self.config.min_delay
+
+        # Longer spacing after a recent 429
+        if self.stats.last_429 and time.time() - self.stats.last_429 < 300:
+            min_delay = max(min_delay, 10.0)
+
+        rate = 1.0 / max(min_delay, 1e-6)
+        cap = float(self.config.burst_capacity)
+
+        async with self._bucket_lock:
+            now = time.monotonic()
+            self._bucket_tokens = min(
+                cap, self._bucket_tokens + (now - self._bucket_last) * rate
+            )
+            self._bucket_last = now
+
+            if self._bucket_tokens < 1.0:
+                wait = (1.0 - self._bucket_tokens) / rate
+                # Keep some jitter so requests don't form a regular train
+                if self.config.max_delay > min_delay:
+                    wait += _RNG.uniform(0, self.config.max_delay - min_delay)
+                await asyncio.sleep(wait)
+                self._bucket_tokens = 0.0
+                self._bucket_last = time.monotonic()
+            else:
+                self._bucket_tokens -= 1.0
 
     async def _handle_429(self):
         """Handle rate limit response."""
         self.stats.rate_limited += 1
         self.stats.last_429 = time.time()
 
-        # Rotate User-Agent
-        self._current_ua = secrets.choice(USER_AGENTS)
+        # UA already rotates per request via the deck in _get_headers
 
         # Rotate TOR circuit if available
         if self.config.tor_rotate_on_429 and self.tor:
-            print("[Reddit] Rate limited - rotating TOR circuit...")
+            logger.info("Rate limited - rotating TOR circuit")
             await self.tor.rotate_circuit()
 
         # Wait before retry
-        wait_time = self.config.rate_limit_backoff + secrets.SystemRandom().uniform(0, 30)
-        print(f"[Reddit] Rate limited - waiting {wait_time:.0f}s...")
+        wait_time = self.config.rate_limit_backoff + _RNG.uniform(0, 30)
+        # Lazy %-formatting: the message is only built if a handler wants it
+        logger.warning("Rate limited - waiting %.0fs", wait_time)
         await asyncio.sleep(wait_time)
 
     async def fetch(
@@ -167,9 +392,27 @@ class RedditBypass:
         Returns:
             Page content or None on failure
         """
+        url = self._transform_url(url)
+
+        cached = self._cache_get(url)
+        if cached is not None:
+            return cached
+
+        # Single-flight: concurrent fetches of the same URL coalesce onto
+        # one in-flight request instead of double-spending the rate-limit
+        # budget (same pattern as Engine.scrape)
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._do_fetch(url, max_retries))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _t, u=url: self._inflight.pop(u, None))
+        return await asyncio.shield(task)
+
+    async def _do_fetch(self, url: str, max_retries: int) -> str | None:
+        """Run the retry loop for a single (already transformed) URL."""
         import httpx
 
-        url = self._transform_url(url)
+        redirect_budget = 2
 
         for attempt in range(max_retries):
             await self._wait_for_rate_limit()
@@ -188,33 +431,60 @@ class RedditBypass:
                     proxy = self.tor.proxy_url
                     timeout = 60.0
 
-                # Make request
-                async with httpx.AsyncClient(proxy=proxy, timeout=timeout) as client:
-                    response = await client.get(url, headers=headers, follow_redirects=True)
-
-                    # Handle rate limit
-                    if response.status_code == 429:
-                        await self._handle_429()
-                        continue
-
-                    # Handle other errors
-                    if response.status_code >= 400:
+                # Make request on the pooled client (connection reuse);
+                # racing mode fans out over several proxies at once
+                can_race = self.proxy_manager is not None or proxy is not None
+                if self.config.race_k > 1 and can_race:
+                    response, proxy = await self._race(url, headers, timeout)
+                    if response is None:
                         self.stats.errors += 1
-                        print(f"[Reddit] Error {response.status_code}: {url}")
                         continue
-
-                    self.stats.successful += 1
-                    return response.text
+                else:
+                    client = self._client(proxy)
+                    response = await client.get(url, headers=headers, timeout=timeout)
+
+                # Follow the rare remaining redirect manually, within a
+                # small budget
+                if 300 <= response.status_code < 400:
+                    location = response.headers.get("location")
+                    if location and redirect_budget > 0:
+                        redirect_budget -= 1
+                        url = urljoin(url, location)
+                        continue
+                    self.stats.errors += 1
+                    continue
+
+                # Handle rate limit
+                if response.status_code == 429:
+                    if self.proxy_manager is not None and proxy:
+                        self.proxy_manager.report_failure(proxy, is_block=True)
+                    await self._handle_429()
+                    continue
+
+                # Handle other errors
+                if response.status_code >= 400:
+                    if self.proxy_manager is not None and proxy:
+                        self.proxy_manager.report_failure(proxy)
+                    self.stats.errors += 1
+                    logger.warning("Error %s: %s", response.status_code, url)
+                    continue
+
+                if self.proxy_manager is not None and proxy:
+                    self.proxy_manager.report_success(proxy)
+                self.stats.successful += 1
+                self._cache_put(url, response.text)
+                return response.text
 
             except httpx.TimeoutException:
-                print(f"[Reddit] Timeout on attempt {attempt + 1}: {url}")
+                logger.warning("Timeout on attempt %d: %s", attempt + 1, url)
                 self.stats.errors += 1
 
             except Exception as e:
-                print(f"[Reddit] Error on attempt {attempt + 1}: {e}")
+                logger.warning("Error on attempt %d: %s", attempt + 1, e)
                 self.stats.errors += 1
 
-        return None
+        # Stale-if-error: an expired listing beats no listing at all
+        return self._cache_get(url, allow_stale=True)
 
     async def fetch_subreddit(
         self,
@@ -238,21 +508,74 @@ class RedditBypass:
 
         content = await self.fetch(url)
         if content:
-            import json
             try:
-                return json.loads(content)
-            except json.JSONDecodeError:
+                return _json_loads(content)
+            except ValueError:
                 return None
         return None
 
+    async def iter_pages(
+        self,
+        subreddit: str,
+        sort: str = "hot",
+        pages: int = 5,
+        limit: int = 100
+    ):
+        """
+        Yield subreddit listing pages as they arrive.
+
+        Reddit's `after` cursor chains page to page, so pages can't be
+        fetched blind in parallel - but the next page's request starts
+        as soon as its cursor is known, overlapping network time with
+        the caller's processing. The shared token bucket still bounds
+        aggregate request rate.
+        """
+        task = asyncio.create_task(
+            self.fetch_subreddit(subreddit, sort=sort, limit=limit)
+        )
+        fetched = 0
+        while task is not None:
+            page = await task
+            task = None
+            if not page or "data" not in page:
+                return
+            fetched += 1
+            after = page["data"].get("after")
+            if after and fetched < pages:
+                # Prefetch the next page while this one is consumed
+                task = asyncio.create_task(
+                    self.fetch_subreddit(
+                        subreddit, sort=sort, limit=limit, after=after
+                    )
+                )
+            yield page
+
+    async def fetch_pages(
+        self,
+        subreddit: str,
+        sort: str = "hot",
+        pages: int = 5,
+        limit: int = 100
+    ) -> dict[str, Any] | None:
+        """Fetch up to `pages` listing pages merged into one result."""
+        merged: dict[str, Any] | None = None
+        async for page in self.iter_pages(subreddit, sort=sort, pages=pages, limit=limit):
+            if merged is None:
+                merged = page
+            else:
+                merged["data"]["children"].extend(
+                    page["data"].get("children", [])
+                )
+                merged["data"]["after"] = page["data"].get("after")
+        return merged
+
     async def fetch_post(self, url: str) -> dict[str, Any] | None:
         """Fetch a single post with comments."""
         content = await self.fetch(url)
         if content:
-            import json
             try:
-                return json.loads(content)
-            except json.JSONDecodeError:
+                return _json_loads(content)
+            except ValueError:
                 return None
         return None
 
@@ -287,10 +610,9 @@ class RedditBypass:
 
         content = await self.fetch(url)
         if content:
-            import json
             try:
-                return json.loads(content)
-            except json.JSONDecodeError:
+                return _json_loads(content)
+            except ValueError:
                 return None
         return None
 
@@ -303,6 +625,16 @@ class RedditBypass:
             "errors": self.stats.errors,
             "success_rate": f"{(self.stats.successful / max(1, self.stats.total_requests)) * 100:.1f}%",
             "current_user_agent": self._current_ua[:50] + "...",
+            # Timestamps stay raw floats on the hot path; only convert
+            # to human-readable datetimes here, when someone asks
+            "last_request": (
+                datetime.fromtimestamp(self.stats.last_request).isoformat()
+                if self.stats.last_request else None
+            ),
+            "last_429": (
+                datetime.fromtimestamp(self.stats.last_429).isoformat()
+                if self.stats.last_429 else None
+            ),
         }
 
 
@@ -319,21 +651,36 @@ class RedditOAuth:
         self.client_secret = client_secret
         self.user_agent = user_agent
         self._token: str | None = None
-        self._expiry: datetime | None = None
+        # Monotonic deadline - no datetime allocation per gated call
+        self._expiry: float = 0.0
+        self._httpx = None
+        # The basic-auth header never changes; encode it once
+        auth = base64.b64encode(
+            f"{client_id}:{client_secret}".encode()
+        ).decode()
+        self._auth_header = f"Basic {auth}"
+
+    def _client(self):
+        """Get (or create) the pooled client."""
+        import httpx
 
-    async def get_token(self, username: str = None, password: str = None) -> str | None:
-        """Get OAuth token."""
-        import base64
+        if self._httpx is None:
+            self._httpx = httpx.AsyncClient(timeout=httpx.Timeout(30.0))
+        return self._httpx
 
-        import httpx
+    async def aclose(self):
+        """Close the pooled connection."""
+        if self._httpx is not None:
+            await self._httpx.aclose()
+            self._httpx = None
 
-        if self._token and self._expiry and datetime.now() < self._expiry:
+    async def get_token(self, username: str = None, password: str = None) -> str | None:
+        """Get OAuth token."""
+        if self._token and time.monotonic() < self._expiry:
             return self._token
 
-        auth = base64.b64encode(f"{self.client_id}:{self.client_secret}".encode()).decode()
-
         headers = {
-            "Authorization": f"Basic {auth}",
+            "Authorization": self._auth_header,
             "User-Agent": self.user_agent,
             "Content-Type": "application/x-www-form-urlencoded",
         }
@@ -352,22 +699,21 @@ class RedditOAuth:
             }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://www.reddit.com/api/v1/access_token",
-                    headers=headers,
-                    data=data
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    self._token = result.get("access_token")
-                    expires_in = result.get("expires_in", 3600)
-                    self._expiry = datetime.now() + timedelta(seconds=expires_in - 60)
-                    return self._token
+            response = await self._client().post(
+                "https://www.reddit.com/api/v1/access_token",
+                headers=headers,
+                data=data
+            )
+
+            if response.status_code == 200:
+                result = _json_loads(response.content)
+                self._token = result.get("access_token")
+                expires_in = result.get("expires_in", 3600)
+                self._expiry = time.monotonic() + expires_in - 60
+                return self._token
 
         except Exception as e:
-            print(f"[Reddit OAuth] Error: {e}")
+            logger.error("OAuth error: %s", e)
 
         return None
 
@@ -379,8 +725,6 @@ class RedditOAuth:
         data: dict = None
     ) -> dict | None:
         """Make authenticated API request."""
-        import httpx
-
         token = await self.get_token()
         if not token:
             return None
@@ -393,17 +737,17 @@ class RedditOAuth:
         url = f"https://oauth.reddit.com{endpoint}"
 
         try:
-            async with httpx.AsyncClient() as client:
-                if method == "GET":
-                    response = await client.get(url, headers=headers, params=params)
-                else:
-                    response = await client.post(url, headers=headers, data=data)
+            client = self._client()
+            if method == "GET":
+                response = await client.get(url, headers=headers, params=params)
+            else:
+                response = await client.post(url, headers=headers, data=data)
 
-                if response.status_code == 200:
-                    return response.json()
+            if response.status_code == 200:
+                return _json_loads(response.content)
 
         except Exception as e:
-            print(f"[Reddit API] Error: {e}")
+            logger.error("API error: %s", e)
 
         return None
 
@@ -15,19 +15,122 @@ Usage:
 import asyncio
 import json
 import sys
-from dataclasses import asdict, dataclass
+import threading
+import types
+from dataclasses import dataclass
 from typing import Any
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+
+def _loads(data):
+    """Parse a JSON-RPC line via orjson's C parser when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_line(obj) -> bytes:
+    """Encode a response to compact JSON bytes for the stdio transport."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _dumps_pretty(obj) -> str:
+    """Indented JSON for human-facing content blocks."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+# Known .onion sites. The index is static, so every response shape the
+# get_onion_index tool can return is built once at import; each call is
+# then a single dict lookup
+_ONIONS = {
+    "search": [
+        "duckduckgogg42xjoc72x3sjasowoarfbgcmvfimaftt6twagswzczad.onion",
+        "juhanurmihxlp77nkq76byazcldy2hlmovfu2epvl5ankdibsot4csyd.onion",
+    ],
+    "news": [
+        "bbcnewsd73hkzno2ini43t4gblxvycyac5aw4gnv7t2rccijh7745uqd.onion",
+        "nytimesn7cgmftshazwhfgzm37qxb44r64ytbb2dj3x62d2lljsciiyd.onion",
+    ],
+    "social": [
+        "facebookwkhpilnemxj7asaniu7vnjjbiltxjqhye3mhbshg7kx5tfyd.onion",
+        "protonmailrmez3lotccipshtkleegetolb73fuirgj7r4o4vfu7ozyd.onion",
+    ],
+}
+_ONIONS_ALL = {"onions": _ONIONS}
+_ONIONS_BY_CATEGORY = {c: {"onions": {c: v}} for c, v in _ONIONS.items()}
+
+# Read-only view for in-process consumers. The wire payloads above stay
+# plain dicts/lists because neither orjson nor stdlib json can encode a
+# mappingproxy (and orjson rejects tuples); responses already return
+# these shared constants by reference, so no per-call allocation remains
+ONION_CATEGORIES = types.MappingProxyType(_ONIONS)
+
+
+class AsyncLoopThread(threading.Thread):
+    """
+    Background thread owning one persistent event loop.
+
+    Lets synchronous hosts (CLI, Jupyter, GUI) issue tool calls through
+    run_coroutine_threadsafe without spinning up a loop per call or
+    tripping over an already-running loop in the host.
+    """
+
+    def __init__(self):
+        super().__init__(name="mcp-loop", daemon=True)
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._ready = threading.Event()
+
+    def run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self._ready.set()
+        self.loop.run_forever()
 
-@dataclass
+    def wait_ready(self, timeout: float | None = None) -> asyncio.AbstractEventLoop:
+        """Block until the loop exists and is running."""
+        self._ready.wait(timeout)
+        return self.loop
+
+    def stop(self):
+        """Stop the loop from any thread."""
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+@dataclass(slots=True, frozen=True)
 class MCPTool:
     """MCP Tool definition."""
     name: str
     description: str
     input_schema: dict[str, Any]
 
+    def to_dict(self) -> dict[str, Any]:
+        """Wire-format dict. Unlike asdict(), this shares the schema by
+        reference instead of deep-copying it - the definitions never
+        mutate - and uses the camelCase key the MCP protocol expects."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "inputSchema": self.input_schema,
+        }
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MCPResource:
     """MCP Resource definition."""
     uri: str
@@ -35,6 +138,15 @@ class MCPResource:
     description: str
     mime_type: str = "application/json"
 
+    def to_dict(self) -> dict[str, Any]:
+        """Wire-format dict (camelCase mimeType, no deep copy)."""
+        return {
+            "uri": self.uri,
+            "name": self.name,
+            "description": self.description,
+            "mimeType": self.mime_type,
+        }
+
 
 class DeadManMCPServer:
     """
@@ -56,6 +168,37 @@ class DeadManMCPServer:
         self.tools = self._define_tools()
         self.resources = self._define_resources()
         self._scraped_data: dict[str, Any] = {}
+        # tools/list and resources/list never change after startup;
+        # serialize the dataclasses once instead of per request
+        self._tools_list_payload = [t.to_dict() for t in self.tools]
+        self._resources_list_payload = [r.to_dict() for r in self.resources]
+        # Codegen'd argument validators: a malformed tools/call dies in
+        # microseconds at the door instead of seconds into a scrape
+        self._validators: dict[str, Any] = {}
+        if HAS_FASTJSONSCHEMA:
+            self._validators = {
+                t.name: fastjsonschema.compile(t.input_schema)
+                for t in self.tools
+            }
+        # Dispatch tables: one hash lookup per request instead of
+        # walking an if/elif chain of string compares
+        self._method_handlers = {
+            "initialize": self._handle_initialize,
+            "tools/list": self._handle_tools_list,
+            "tools/call": self._handle_tools_call,
+            "resources/list": self._handle_resources_list,
+            "resources/read": self._handle_resources_read,
+        }
+        self._tool_handlers = {
+            "scrape_url": self._tool_scrape_url,
+            "scrape_onion": self._tool_scrape_onion,
+            "search_reddit": self._tool_search_reddit,
+            "search_github": self._tool_search_github,
+            "deep_scrape": self._tool_deep_scrape,
+            "get_onion_index": self._tool_get_onion_index,
+        }
+        # Lazily started loop thread backing call_tool_sync
+        self._loop_thread: AsyncLoopThread | None = None
 
     def _define_tools(self) -> list[MCPTool]:
         """Define available MCP tools."""
@@ -231,68 +374,89 @@ class DeadManMCPServer:
         params = request.get("params", {})
         request_id = request.get("id")
 
-        try:
-            if method == "initialize":
-                return self._response(request_id, {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {
-                        "tools": {"listChanged": False},
-                        "resources": {"subscribe": False, "listChanged": False},
-                    },
-                    "serverInfo": {
-                        "name": "deadman-scraper",
-                        "version": "1.0.0"
-                    }
-                })
-
-            elif method == "tools/list":
-                return self._response(request_id, {
-                    "tools": [asdict(t) for t in self.tools]
-                })
-
-            elif method == "tools/call":
-                tool_name = params.get("name")
-                arguments = params.get("arguments", {})
-                result = await self._execute_tool(tool_name, arguments)
-                return self._response(request_id, {
-                    "content": [{"type": "text", "text": json.dumps(result, indent=2)}]
-                })
-
-            elif method == "resources/list":
-                return self._response(request_id, {
-                    "resources": [asdict(r) for r in self.resources]
-                })
-
-            elif method == "resources/read":
-                uri = params.get("uri")
-                content = await self._read_resource(uri)
-                return self._response(request_id, {
-                    "contents": [{"uri": uri, "text": json.dumps(content, indent=2)}]
-                })
-
-            else:
-                return self._error(request_id, -32601, f"Method not found: {method}")
+        handler = self._method_handlers.get(method)
+        if handler is None:
+            return self._error(request_id, -32601, f"Method not found: {method}")
 
+        try:
+            return await handler(request_id, params)
         except Exception as e:
             return self._error(request_id, -32603, str(e))
 
+    async def _handle_initialize(self, request_id: Any, params: dict) -> dict:
+        return self._response(request_id, {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {
+                "tools": {"listChanged": False},
+                "resources": {"subscribe": False, "listChanged": False},
+            },
+            "serverInfo": {
+                "name": "deadman-scraper",
+                "version": "1.0.0"
+            }
+        })
+
+    async def _handle_tools_list(self, request_id: Any, params: dict) -> dict:
+        return self._response(request_id, {
+            "tools": self._tools_list_payload
+        })
+
+    async def _handle_tools_call(self, request_id: Any, params: dict) -> dict:
+        tool_name = params.get("name")
+        arguments = params.get("arguments", {})
+        result = await self._execute_tool(tool_name, arguments)
+        return self._response(request_id, {
+            "content": [{"type": "text", "text": _dumps_pretty(result)}]
+        })
+
+    async def _handle_resources_list(self, request_id: Any, params: dict) -> dict:
+        return self._response(request_id, {
+            "resources": self._resources_list_payload
+        })
+
+    async def _handle_resources_read(self, request_id: Any, params: dict) -> dict:
+        uri = params.get("uri")
+        content = await self._read_resource(uri)
+        return self._response(request_id, {
+            "contents": [{"uri": uri, "text": _dumps_pretty(content)}]
+        })
+
+    def call_tool_sync(
+        self, name: str, args: dict[str, Any], timeout: float = 60.0
+    ) -> dict[str, Any]:
+        """
+        Execute a tool from synchronous code.
+
+        The first call starts a persistent background loop; subsequent
+        calls reuse it via run_coroutine_threadsafe, so no loop is
+        created per call and callers inside a running loop (Jupyter)
+        don't collide with it.
+        """
+        if self._loop_thread is None:
+            self._loop_thread = AsyncLoopThread()
+            self._loop_thread.start()
+            self._loop_thread.wait_ready()
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._execute_tool(name, args), self._loop_thread.loop
+        )
+        return future.result(timeout)
+
     async def _execute_tool(self, name: str, args: dict[str, Any]) -> dict[str, Any]:
         """Execute a tool and return result."""
-        if name == "scrape_url":
-            return await self._tool_scrape_url(args)
-        elif name == "scrape_onion":
-            return await self._tool_scrape_onion(args)
-        elif name == "search_reddit":
-            return await self._tool_search_reddit(args)
-        elif name == "search_github":
-            return await self._tool_search_github(args)
-        elif name == "deep_scrape":
-            return await self._tool_deep_scrape(args)
-        elif name == "get_onion_index":
-            return await self._tool_get_onion_index(args)
-        else:
+        handler = self._tool_handlers.get(name)
+        if handler is None:
             return {"error": f"Unknown tool: {name}"}
 
+        validator = self._validators.get(name)
+        if validator is not None:
+            try:
+                validator(args)
+            except fastjsonschema.JsonSchemaException as e:
+                return {"error": f"Invalid arguments for {name}: {e}"}
+
+        return await handler(args)
+
     async def _tool_scrape_url(self, args: dict) -> dict:
         """Scrape URL tool implementation."""
         url = args.get("url")
@@ -354,25 +518,9 @@ class DeadManMCPServer:
         """Get onion index tool implementation."""
         category = args.get("category", "all")
 
-        # Load from onion index file
-        onions = {
-            "search": [
-                "duckduckgogg42xjoc72x3sjasowoarfbgcmvfimaftt6twagswzczad.onion",
-                "juhanurmihxlp77nkq76byazcldy2hlmovfu2epvl5ankdibsot4csyd.onion",
-            ],
-            "news": [
-                "bbcnewsd73hkzno2ini43t4gblxvycyac5aw4gnv7t2rccijh7745uqd.onion",
-                "nytimesn7cgmftshazwhfgzm37qxb44r64ytbb2dj3x62d2lljsciiyd.onion",
-            ],
-            "social": [
-                "facebookwkhpilnemxj7asaniu7vnjjbiltxjqhye3mhbshg7kx5tfyd.onion",
-                "protonmailrmez3lotccipshtkleegetolb73fuirgj7r4o4vfu7ozyd.onion",
-            ],
-        }
-
         if category == "all":
-            return {"onions": onions}
-        return {"onions": {category: onions.get(category, [])}}
+            return _ONIONS_ALL
+        return _ONIONS_BY_CATEGORY.get(category, {"onions": {category: []}})
 
     async def _read_resource(self, uri: str) -> dict[str, Any]:
         """Read a resource."""
@@ -400,28 +548,77 @@ class DeadManMCPServer:
             "error": {"code": code, "message": message}
         }
 
+    # Cap on concurrently executing requests in the stdio loop
+    MAX_INFLIGHT_REQUESTS = 16
+
     async def run_stdio(self):
         """Run server over stdio (for Claude integration)."""
         print("DeadMan MCP Server started", file=sys.stderr)
 
-        while True:
+        loop = asyncio.get_running_loop()
+        # Attach stdin to the event loop: reads become native
+        # non-blocking instead of parking an executor thread on readline
+        reader = asyncio.StreamReader(loop=loop)
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader, loop=loop), sys.stdin
+        )
+
+        semaphore = asyncio.Semaphore(self.MAX_INFLIGHT_REQUESTS)
+        pending: set[asyncio.Task] = set()
+        out_q: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+        async def writer():
+            # Single writer coalesces everything pending into one
+            # write+flush, so N concurrent tool completions cost one
+            # syscall instead of N (None is the shutdown sentinel)
+            shutdown = False
+            while not shutdown:
+                first = await out_q.get()
+                if first is None:
+                    return
+                batch = [first]
+                while not out_q.empty():
+                    item = out_q.get_nowait()
+                    if item is None:
+                        # Flush what we have, then stop
+                        shutdown = True
+                        break
+                    batch.append(item)
+                sys.stdout.buffer.write(b"\n".join(batch) + b"\n")
+                sys.stdout.buffer.flush()
+
+        writer_task = asyncio.create_task(writer())
+
+        async def dispatch(request: dict[str, Any]):
             try:
-                line = await asyncio.get_event_loop().run_in_executor(
-                    None, sys.stdin.readline
-                )
-                if not line:
-                    break
+                async with semaphore:
+                    response = await self.handle_request(request)
+                await out_q.put(_dumps_line(response))
+            except Exception as e:
+                print(f"Error: {e}", file=sys.stderr)
 
-                request = json.loads(line.strip())
-                response = await self.handle_request(request)
-                print(json.dumps(response), flush=True)
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
 
-            except json.JSONDecodeError:
+            try:
+                # orjson tolerates surrounding whitespace; both parsers
+                # raise ValueError subclasses on bad input
+                request = _loads(line)
+            except ValueError:
                 continue
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                print(f"Error: {e}", file=sys.stderr)
+
+            # Pipelining: keep reading the next request while earlier
+            # tools are still running
+            task = asyncio.create_task(dispatch(request))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await out_q.put(None)
+        await writer_task
 
 
 def main():
@@ -5,6 +5,8 @@ NASA Standard: Specialized scraper for Costco warehouse intelligence.
 Inherits from SiteScraper base class.
 """
 
+import asyncio
+import html as html_module
 import json
 import logging
 import re
@@ -12,8 +14,30 @@ from typing import Any
 
 from deadman_scraper.scrapers.base import SiteScraper
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger("CostcoScraper")
 
+# Patterns compiled once at import; per-scrape re.search(str, ...) calls
+# pay a cache hash+lookup per pattern that compiled objects skip.
+# The four product-page fields are fused into one alternation so the
+# HTML is scanned once instead of four times; m.lastgroup says which
+# field a given match carries
+_PRODUCT_RE = re.compile(
+    r'discount_count["\\]*s*:+(?P<discount>\d+)'
+    r'|enriched_name["\\]*s*:+(?P<name>[^"\\]+)'
+    r'|store_id\":(?P<store_id>\d+)'
+    r'|store_name\":\"(?P<store_name>[A-Za-z\s]+)\"'
+)
+_WH_NUM_RE = re.compile(r'-(\d+)$')
+_SCHEMA_RE = re.compile(
+    r'name="script-type-application/ld\+json"\s+content="([^"]+)"'
+)
+
 class CostcoScraper(SiteScraper):
     """
     Scraper for extracting warehouse-specific information from Costco.
@@ -52,24 +76,49 @@ class CostcoScraper(SiteScraper):
             "warehouses_found": len(warehouses)
         }
 
+    async def scrape_many(
+        self, item_ids: list[str], concurrency: int = 8
+    ) -> list[Any]:
+        """
+        Scrape a batch of items concurrently.
+
+        A bounded semaphore keeps at most `concurrency` item pipelines
+        in flight, so batch wall time approaches the slowest item
+        instead of the sum. Failed items come back as exceptions in
+        their slot rather than aborting the batch.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(item_id: str) -> dict[str, Any]:
+            async with sem:
+                return await self.scrape(item_id)
+
+        return await asyncio.gather(
+            *(one(i) for i in item_ids), return_exceptions=True
+        )
+
     def _parse_product_page(self, html: str, item_id: str) -> dict[str, Any]:
         """Extract product-level data."""
         # Ported logic from warehouse_detail_scraper.py
-        discount_match = re.search(r'discount_count["\\]*s*:+(\d+)', html)
-        discount_count = int(discount_match.group(1)) if discount_match else 0
-
-        product_match = re.search(r'enriched_name["\\]*s*:+([^"\\]+)', html)
-        product_name = product_match.group(1).replace('\\', '') if product_match else ''
+        # One pass over the page; keep the first occurrence per field
+        # (matching the old per-pattern search semantics) and bail out
+        # once all four are in hand
+        found: dict[str, str] = {}
+        for m in _PRODUCT_RE.finditer(html):
+            kind = m.lastgroup
+            if kind not in found:
+                found[kind] = m.group(kind)
+                if len(found) == 4:
+                    break
+
+        discount_count = int(found['discount']) if 'discount' in found else 0
+        product_name = found['name'].replace('\\', '') if 'name' in found else ''
 
         # Store ID and Name for first warehouse
         first_warehouse_url = None
-        store_id_match = re.search(r'store_id\":(\d+)', html)
-        store_name_match = re.search(r'store_name\":\"([A-Za-z\s]+)\"', html)
-
-        if store_id_match and store_name_match:
-            store_id = store_id_match.group(1)
-            store_name = store_name_match.group(1).strip().lower().replace(' ', '-')
-            first_warehouse_url = f'/store/{store_name}-{store_id}'
+        if 'store_id' in found and 'store_name' in found:
+            store_name = found['store_name'].strip().lower().replace(' ', '-')
+            first_warehouse_url = f"/store/{store_name}-{found['store_id']}"
 
         return {
             'item_id': item_id,
@@ -81,22 +130,21 @@ class CostcoScraper(SiteScraper):
     def _parse_warehouse_details(self, html: str, url_path: str) -> dict[str, Any] | None:
         """Extract detailed warehouse information from schema data."""
         # Extract warehouse number
-        wh_num_match = re.search(r'-(\d+)$', url_path)
+        wh_num_match = _WH_NUM_RE.search(url_path)
         wh_num = int(wh_num_match.group(1)) if wh_num_match else None
 
         # Extract LD+JSON
-        schema_match = re.search(
-            r'name="script-type-application/ld\+json"\s+content="([^"]+)"',
-            html
-        )
+        schema_match = _SCHEMA_RE.search(html)
         if not schema_match:
             return None
 
-        import html as html_module
-        schema_json = html_module.unescape(schema_match.group(1))
+        raw = schema_match.group(1)
+        # Most pages carry the attribute without entities; only pay for
+        # the full unescape scan when an '&' is actually present
+        schema_json = html_module.unescape(raw) if '&' in raw else raw
 
         try:
-            data = json.loads(schema_json)
+            data = orjson.loads(schema_json) if HAS_ORJSON else json.loads(schema_json)
             address = data.get('address', {})
             geo = data.get('geo', {})
 
@@ -111,5 +159,6 @@ class CostcoScraper(SiteScraper):
                 'longitude': geo.get('longitude'),
                 'phone': data.get('telephone', '')
             }
-        except json.JSONDecodeError:
+        except ValueError:
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError
             return None
@@ -42,16 +42,19 @@ class WeaponryManager:
             logger.info(f"Opening {service['name']} - {service['benefit']}")
             webbrowser.open(service['url'])
 
+    # Lowercased lookup keys computed once; get_status_report runs on
+    # every status poll and the names never change
+    SERVICES_INDEXED = tuple((s['name'].lower(), s) for s in SERVICES)
+
     def get_status_report(self, config_api_keys: dict) -> list[dict[str, str]]:
         """
         Check which weapons are currently loaded.
         """
-        report = []
-        for service in self.SERVICES:
-            name_lower = service['name'].lower()
-            report.append({
+        return [
+            {
                 "service": service['name'],
-                "status": "LOADED" if name_lower in config_api_keys else "MISSING",
-                "benefit": service['benefit']
-            })
-        return report
+                "status": "LOADED" if key in config_api_keys else "MISSING",
+                "benefit": service['benefit'],
+            }
+            for key, service in self.SERVICES_INDEXED
+        ]
@@ -6,6 +6,7 @@ Purges temporary folders and legacy files.
 """
 
 import logging
+import os
 import shutil
 from pathlib import Path
 
@@ -30,29 +31,30 @@ class ProjectPurge:
         """Perform the purge and organization."""
         logger.info("Starting NASA-standard project purge...")
 
-        # 1. Move Logs
-        for log in self.root.glob("*.log*"):
-            if log.name != "central_scraper.log": # Keep main log for now
-                shutil.move(str(log), self.log_dir / log.name)
-
-        # 2. Move Data/Scrapes
-        for txt in self.root.glob("scraped_page_*.txt"):
-            shutil.move(str(txt), self.data_dir / txt.name)
-
-        if (self.root / "scraper_discovery.json").exists():
-            shutil.move(str(self.root / "scraper_discovery.json"), self.data_dir / "scraper_discovery.json")
-
-        # 3. Purge Temporary Folders
-        for tmp_folder in self.root.glob("tmpclaude-*"):
-            if tmp_folder.is_dir():
-                try:
-                    shutil.rmtree(tmp_folder)
-                except Exception as e:
-                    logger.warning(f"Could not delete {tmp_folder}: {e}")
-
-        # 4. Handle Local DBs
-        for db in self.root.glob("*.db"):
-            shutil.move(str(db), self.data_dir / db.name)
+        # One scandir pass classifies every entry, instead of four full
+        # directory globs; os.replace is a plain rename (everything here
+        # stays on the same filesystem) without shutil.move's stat/copy
+        # fallback machinery
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                name = entry.name
+
+                if entry.is_dir(follow_symlinks=False):
+                    # Purge temporary folders
+                    if name.startswith("tmpclaude-"):
+                        try:
+                            shutil.rmtree(entry.path)
+                        except Exception as e:
+                            logger.warning(f"Could not delete {entry.path}: {e}")
+                    continue
+
+                if ".log" in name:
+                    if name != "central_scraper.log": # Keep main log for now
+                        os.replace(entry.path, self.log_dir / name)
+                elif name.startswith("scraped_page_") and name.endswith(".txt"):
+                    os.replace(entry.path, self.data_dir / name)
+                elif name == "scraper_discovery.json" or name.endswith(".db"):
+                    os.replace(entry.path, self.data_dir / name)
 
         logger.info("Purge complete. Project root is now NASA-standard clean.")
 
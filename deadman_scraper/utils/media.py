@@ -17,15 +17,21 @@ class MediaLaunderer:
     Cleans media files by removing SynthID and other watermarking signatures.
     """
 
-    @staticmethod
-    def check_ffmpeg() -> bool:
-        """Verify ffmpeg is installed and available."""
-        try:
-            subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            logger.error("FFmpeg not found in PATH.")
-            return False
+    # Memoized result of the availability probe; ffmpeg doesn't appear
+    # or vanish mid-session, so one ~100ms subprocess spawn is enough
+    _ffmpeg_ok: bool | None = None
+
+    @classmethod
+    def check_ffmpeg(cls) -> bool:
+        """Verify ffmpeg is installed and available (cached)."""
+        if cls._ffmpeg_ok is None:
+            try:
+                subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
+                cls._ffmpeg_ok = True
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                logger.error("FFmpeg not found in PATH.")
+                cls._ffmpeg_ok = False
+        return cls._ffmpeg_ok
 
     @staticmethod
     def clean_audio(input_path: Path, output_path: Path | None = None) -> Path | None:
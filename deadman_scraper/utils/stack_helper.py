@@ -5,6 +5,7 @@ Automates the verification and submission of Graphite stacks.
 Ensures every increment meets quality gates before hitting GitHub.
 """
 
+import importlib.util
 import subprocess
 import logging
 import sys
@@ -35,7 +36,12 @@ class MissionStacker:
         
         # 2. Unit Tests
         logger.info("Running Unit Test Suite...")
-        test_result = subprocess.run(["pytest", "tests/unit"], cwd=str(project_root))
+        pytest_cmd = ["pytest", "tests/unit"]
+        if importlib.util.find_spec("xdist") is not None:
+            # Shard the suite across all cores; loadfile distribution
+            # keeps each file's fixtures inside one worker
+            pytest_cmd += ["-n", "auto", "--dist", "loadfile"]
+        test_result = subprocess.run(pytest_cmd, cwd=str(project_root))
         
         if test_result.returncode != 0:
             logger.error("Quality gate FAILED. Fix errors before stacking.")
@@ -54,13 +54,13 @@ async def run_full_validation():
         # 3. Traceability Verification
         print("\n[*] STEP 3: Verifying Audit Traceability...")
         from pathlib import Path
-        audit_file = Path("nasa_audit_trail.jsonl")
+        from deadman_scraper.utils.traceability import AuditLogger
+        audit_file = Path("nasa_audit_trail.jsonl.gz")
         if audit_file.exists():
-            with open(audit_file, "r") as f:
-                last_lines = f.readlines()[-5:]
-                print(f"[+] Audit Trail found. Last {len(last_lines)} events logged:")
-                for line in last_lines:
-                    print(f"    {line.strip()}")
+            last_events = list(AuditLogger.iter_events(audit_file))[-5:]
+            print(f"[+] Audit Trail found. Last {len(last_events)} events logged:")
+            for event in last_events:
+                print(f"    {json.dumps(event)}")
         else:
             print("[!] Audit Trail missing!")
 